@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from mangum import Mangum
@@ -11,13 +14,31 @@ from routers import (
     llm_config,
     agents_router,
 )
+from routers.methods.item_utils import warm_dynamodb_connection
+from routers.methods.verification_job_utils import warm_sqs_connection
+from utils.s3_helpers import warm_presign_credentials
+
 # from app.routers import items, users
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Prime the DynamoDB and SQS connections and presign credentials on cold start,
+    # so the first request, job creation and upload/download URL don't pay for them
+    await asyncio.gather(
+        asyncio.to_thread(warm_dynamodb_connection),
+        asyncio.to_thread(warm_sqs_connection),
+        asyncio.to_thread(warm_presign_credentials),
+    )
+    yield
+
+
 app = FastAPI(
     title="Computer Vision Image Verification API",
     description="FastAPI backend for the Computer Vision Image Verification sample.",
     version="0.1.0",
     terms_of_service="https://aws.amazon.com/asl/",
+    lifespan=lifespan,
 )
 
 # Configure CORS
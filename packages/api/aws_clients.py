@@ -0,0 +1,43 @@
+from functools import lru_cache
+
+import boto3
+from botocore.config import Config
+
+from constants import AWS_REGION
+
+# Shared AWS clients for the API, so every module reuses the same connection pools.
+# Adaptive retries smooth out throttling, and a larger pool lets concurrent handlers
+# share connections instead of contending for them.
+aws_client_config = Config(
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+    max_pool_connections=64,
+    connect_timeout=1.0,
+)
+# DynamoDB calls are small and fast, so a stalled read is retried rather than waited on
+dynamodb_config = aws_client_config.merge(Config(read_timeout=3.0))
+
+dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION, config=dynamodb_config)
+# Low-level client for hot writes; unlike the resource's own client it does not
+# re-serialise items, so they can be converted once with a shared serializer
+dynamodb_client = boto3.client("dynamodb", region_name=AWS_REGION, config=dynamodb_config)
+# S3 keeps the default read timeout, as bulk deletes of up to 1000 keys can run long
+s3_client = boto3.client(
+    "s3",
+    region_name=AWS_REGION,
+    config=aws_client_config.merge(Config(signature_version="s3v4")),
+)
+# SQS sends are tiny, so like DynamoDB a stalled call is retried rather than waited on
+sqs_client = boto3.client(
+    "sqs", region_name=AWS_REGION, config=aws_client_config.merge(Config(read_timeout=2.0))
+)
+
+
+@lru_cache(maxsize=None)
+def location_client():
+    """
+    Amazon Location client, created on first use and then shared.
+
+    Only the address endpoints need it, so other cold starts skip building it.
+    """
+    return boto3.client("location", region_name=AWS_REGION, config=aws_client_config)
@@ -20,6 +20,7 @@ VERIFICATION_JOB_LOGS_TABLE_NAME = os.getenv(
     "VERIFICATION_JOB_LOGS_TABLE_NAME", "verification-job-logs"
 )
 FILE_CHECKS_TABLE_NAME = os.getenv("FILE_CHECKS_TABLE_NAME", "file-checks")
+JOB_ITEMS_TABLE_NAME = os.getenv("JOB_ITEMS_TABLE_NAME", "job-items")
 LLM_CONFIG_TABLE_NAME = os.getenv("LLM_CONFIG_TABLE_NAME", "llm-config")
 
 # The maximum distance (in kilometers) for address matching
@@ -27,6 +28,10 @@ MAX_ADDRESS_DISTANCE = os.getenv("MAX_ADDRESS_DISTANCE", 0.5)  # in kms
 
 BEDROCK_ROLE_ARN_PARAMETER = os.getenv("BEDROCK_ROLE_ARN_PARAMETER")
 
+# In-process cache of S3 object metadata used when adding files to collections
+S3_HEAD_CACHE_MAX_SIZE = int(os.getenv("S3_HEAD_CACHE_MAX_SIZE", "4096"))
+S3_HEAD_CACHE_TTL_SECONDS = int(os.getenv("S3_HEAD_CACHE_TTL_SECONDS", "300"))
+
 AWS_REGION = os.getenv("AWS_REGION", "ap-southeast-2")
 TAVILY_API_KEY_SECRET = os.getenv("TAVILY_API_KEY_SECRET", "TAVILY_API_KEY_SECRET")
 
@@ -6,31 +6,49 @@ from typing import Optional, Any, cast
 from botocore.exceptions import ClientError
 import io
 
-# Initialize AWS clients
-s3_client = boto3.client("s3")
-rekognition_client = boto3.client("rekognition")
+from aws_clients import aws_client_config
+
+# Initialize AWS clients, pooled so concurrent image fetches don't queue for connections
+s3_client = boto3.client("s3", config=aws_client_config)
+rekognition_client = boto3.client("rekognition", config=aws_client_config)
+
+
+def _read_image_as_png(bucket: str, key: str) -> bytes:
+    """Downloads an image from S3 and re-encodes it as PNG."""
+    response = s3_client.get_object(Bucket=bucket, Key=key)
+    image_bytes: bytes = response["Body"].read()
+
+    # Convert image to PNG format
+    image = PIL.Image.open(io.BytesIO(image_bytes))
+    image_bytes_png_buffer = io.BytesIO()
+    image.save(image_bytes_png_buffer, format="PNG")
+    return image_bytes_png_buffer.getvalue()
 
 
 async def get_image_bytes_from_s3(bucket: str, key: str) -> Optional[bytes]:
     """Retrieve image bytes from S3, and makes sure it is in PNG format."""
     try:
-        response = s3_client.get_object(Bucket=bucket, Key=key)
-        image_bytes: bytes = response["Body"].read()
-        
-        # Convert image to PNG format
-        image = PIL.Image.open(io.BytesIO(image_bytes))
-        image_bytes_png_buffer = io.BytesIO()
-        image.save(image_bytes_png_buffer, format="PNG")
-        image_bytes_png = image_bytes_png_buffer.getvalue()
-        
-        return image_bytes_png
+        # The download and conversion block, so they run in a worker thread
+        return await asyncio.to_thread(_read_image_as_png, bucket, key)
     except ClientError as e:
         if e.response["Error"]["Code"] == "NoSuchKey":
             return None
         raise
 
 
-async def detect_labels_s3(image_bytes: bytes,resize_image:bool) -> list[dict[str, Any]]:
+def _resize_image(image_bytes: bytes) -> bytes:
+    """Shrinks an image to fit within 1024x1024 pixels, returned as PNG."""
+    image = PIL.Image.open(io.BytesIO(image_bytes))
+    max_size = (1024, 1024)
+    image.thumbnail(max_size, PIL.Image.LANCZOS)
+    image_bytes_buffer = io.BytesIO()
+    image.save(image_bytes_buffer, format="PNG")
+    return image_bytes_buffer.getvalue()
+
+
+async def detect_labels_s3(
+    image_bytes: bytes, resize_image: bool, min_confidence: float = 50
+) -> list[dict[str, Any]]:
     """
     Detect labels in an image using AWS Rekognition.
     This asynchronous function sends the provided image bytes to AWS Rekognition
@@ -41,6 +59,8 @@ async def detect_labels_s3(image_bytes: bytes,resize_image:bool) -> list[dict[st
         The binary data of the image to analyze.
     resize_image : bool
         Whether the image should be resized before processing. This prevents images being sent to Rekognition that are too large.
+    min_confidence : float
+        The minimum confidence (0-100) of labels returned by Rekognition. Defaults to 50.
     Returns:
     -------
     list[dict[str, Any]]
@@ -56,8 +76,8 @@ async def detect_labels_s3(image_bytes: bytes,resize_image:bool) -> list[dict[st
     -----
     - The function will attempt up to 50 retries with a 5-second delay between attempts
       when encountering ProvisionedThroughputExceededException.
-    - The detection is configured to return a maximum of 20 labels with a minimum 
-      confidence score of 50%.
+    - The detection is configured to return a maximum of 20 labels with at least
+      min_confidence, filtered by Rekognition itself.
     """
     """Detect labels using Rekognition from image bytes."""
     if not image_bytes:
@@ -68,19 +88,15 @@ async def detect_labels_s3(image_bytes: bytes,resize_image:bool) -> list[dict[st
     
     if resize_image:
         # Resize the image to a maximum of 1024x1024 pixels if it is larger
-        image = PIL.Image.open(io.BytesIO(image_bytes))
-        max_size = (1024, 1024)
-        image.thumbnail(max_size, PIL.Image.LANCZOS)
-        image_bytes_buffer = io.BytesIO()
-        image.save(image_bytes_buffer, format="PNG")
-        image_bytes = image_bytes_buffer.getvalue()
+        image_bytes = await asyncio.to_thread(_resize_image, image_bytes)
     
     for attempt in range(max_retries):
         try:
-            response = rekognition_client.detect_labels(
+            response = await asyncio.to_thread(
+                rekognition_client.detect_labels,
                 Image={"Bytes": image_bytes},
                 MaxLabels=20,
-                MinConfidence=50,
+                MinConfidence=min_confidence,
             )
             labels = cast(list[dict[str, Any]], response.get("Labels", []))
             return labels
@@ -1,5 +1,4 @@
 import time
-import boto3
 from decimal import Decimal
 from typing import Dict, Optional, Any, cast, List
 from botocore.exceptions import ClientError
@@ -14,17 +13,14 @@ from schemas.datamodel import (
     AssessmentStatus,
 )
 
+from aws_clients import dynamodb as dynamodb_resource
 from .conversion import dynamodb_item_to_pydantic
 from constants import (
     VERIFICATION_JOBS_TABLE_NAME,
     COLLECTIONS_TABLE_NAME,
     FILE_CHECKS_TABLE_NAME,
-    AWS_REGION,
 )
 
-# Initialize AWS resource abstraction layer
-dynamodb_resource = boto3.resource("dynamodb", region_name=AWS_REGION)
-
 # Initialize DynamoDB Table References
 verification_jobs_table_name = VERIFICATION_JOBS_TABLE_NAME
 collections_table_name = COLLECTIONS_TABLE_NAME
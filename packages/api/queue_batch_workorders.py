@@ -1,22 +1,28 @@
-import json
 import asyncio
 import mimetypes
+import os
 import time
-from typing import List
+from typing import Iterator, List
 import uuid
-import boto3
 
-from routers.methods.collection_utils import collection_to_dynamodb_item,collections_table
+try:
+    import orjson as _json
+except ImportError:  # Fall back to the stdlib parser if orjson is unavailable
+    import json as _json  # type: ignore[no-redef]
+
+from routers.methods.collection_utils import bulk_create_collections
 from routers.methods.create_verification_job import create_verification_job
 from schemas.requests_responses import CreateVerificationJobRequest
 from schemas.datamodel import Collection, CollectionFile, Item
 
+from aws_clients import s3_client
 from constants import STORAGE_BUCKET_NAME
 
 from routers.methods.item_utils import get_items_by_name
 
 
-s3 = boto3.client("s3")
+# Do one-time initialisation at cold start rather than on the first invocation
+mimetypes.init()
 
 
 def fetch_items_by_name(item_names: list[str]) -> list[Item]:
@@ -32,93 +38,87 @@ def fetch_items_by_name(item_names: list[str]) -> list[Item]:
     return items
 
 
-def get_collection_files(collection_id: str) -> list[CollectionFile]:
-    new_dupes = 0
+def iter_collection_files(collection_id: str) -> Iterator[CollectionFile]:
     prefix = f"collection-batch/{collection_id}/"
+    e_tags = set()
+    created_at = int(time.time())
 
-    try:
-        response = s3.list_objects_v2(Bucket=STORAGE_BUCKET_NAME, Prefix=prefix)
-
-        s3_files = []
-        s3_keys = []
-        e_tags = {}
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=STORAGE_BUCKET_NAME, Prefix=prefix):
+        s3_keys = [obj["Key"] for obj in page.get("Contents", [])]
 
-        if "Contents" in response:
-            for obj in response["Contents"]:
-                s3_keys.append(obj.get("Key"))
+        # Draw randomness for all file IDs on the page in one syscall
+        random_bytes = os.urandom(len(s3_keys) * 16)
 
-        for key in s3_keys:
-            head_response = s3.head_object(Bucket=STORAGE_BUCKET_NAME, Key=key)
+        for i, key in enumerate(s3_keys):
+            head_response = s3_client.head_object(Bucket=STORAGE_BUCKET_NAME, Key=key)
             file_size = head_response.get("ContentLength")
-            content_type = head_response.get("ContentType")
-            content_type, _ = mimetypes.guess_type(key)
-            if not content_type:
-                content_type = "application/octet-stream"
+            content_type = mimetypes.guess_type(key)[0] or "application/octet-stream"
 
             e_tag = head_response.get("ETag")
 
             if e_tag in e_tags:
-                new_dupes += 1
                 continue
 
-            e_tags[e_tag] = True
+            e_tags.add(e_tag)
 
-            file_id = str(uuid.uuid4())
+            file_id = str(
+                uuid.UUID(bytes=random_bytes[i * 16 : (i + 1) * 16], version=4)
+            )
 
-            collection_file = CollectionFile(
+            yield CollectionFile(
                 id=file_id,
                 s3_key=key,
                 size=file_size,
-                created_at=int(time.time()),
+                created_at=created_at,
                 filename=key.split("/")[-1],
                 content_type=content_type,
             )
 
-            s3_files.append(collection_file)
 
-        return s3_files
+def build_collection(collection_id: str, item_csv: str) -> Collection:
+    current_time = int(time.time())
 
-    except Exception:
-        return []
+    fetched_items = fetch_items_by_name(item_csv.split(","))
+    s3_files = list(iter_collection_files(collection_id))
+
+    return Collection(
+        id=collection_id,
+        created_at=current_time,
+        updated_at=current_time,
+        description=collection_id,
+        files=s3_files,
+        items=fetched_items,
+        address=None,
+    )
 
 
 async def process_collections(collections: dict[str, str]):
-    # Create the workorders
-    for wo in collections:
-        collection_id = wo
-        items = collections[wo].split(",")
-
-        current_time = int(time.time())
-
-        fetched_items= fetch_items_by_name(items)
-        s3_files = get_collection_files(collection_id)
-
-        collection = Collection(
-            id=collection_id,
-            created_at=current_time,
-            updated_at=current_time,
-            description=collection_id,
-            files=s3_files,
-            items=fetched_items,
-            address=None,
+    if not collections:
+        return
+
+    # Build every workorder concurrently, store them in BatchWriteItem requests,
+    # then create their verification jobs once all of them exist
+    built = await asyncio.gather(
+        *(asyncio.to_thread(build_collection, wo, collections[wo]) for wo in collections)
+    )
+    await asyncio.to_thread(bulk_create_collections, list(built))
+
+    await asyncio.gather(
+        *(
+            create_verification_job(CreateVerificationJobRequest(collection_id=wo))
+            for wo in collections
         )
-
-        item_data = collection_to_dynamodb_item(collection)
-        collections_table.put_item(Item=item_data)
-
-    # Create the verification Jobs
-    for wo in collections:
-        request = CreateVerificationJobRequest(collection_id=wo)
-        await create_verification_job(request)
+    )
 
 
 def handler(event, context):
     payload = event
 
-    if isinstance(event, str):
-        payload = json.loads(event)
-    elif "body" in event and isinstance(event["body"], str):
-        payload = json.loads(event["body"])
+    if isinstance(event, (str, bytes)):
+        payload = _json.loads(event)
+    elif "body" in event and isinstance(event["body"], (str, bytes)):
+        payload = _json.loads(event["body"])
 
     loop = asyncio.get_event_loop()
     loop.run_until_complete(process_collections(payload))
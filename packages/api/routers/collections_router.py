@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Path, Query, Body, status
+from fastapi.responses import StreamingResponse
 from typing import Optional
 
 # Import necessary models from schemas
@@ -19,6 +20,9 @@ from schemas.requests_responses import (
 
 # Import implementation functions from the methods directory
 from .methods.list_collections import list_collections as list_collections_impl
+from .methods.list_collections import (
+    stream_collections as stream_collections_impl,
+)
 from .methods.address_autocomplete import (
     address_autocomplete as address_autocomplete_impl,
 )
@@ -54,17 +58,59 @@ async def list_collections(
     filter_status: Optional[AssessmentStatus] = Query(  # noqa: B008
         None, alias="status", description="Filter collections by status"
     ),
+    limit: Optional[int] = Query(  # noqa: B008
+        None,
+        description="Read a single page of at most this many collections",
+        ge=1,
+        le=1000,
+    ),
+    last_evaluated_key: Optional[str] = Query(  # noqa: B008
+        None, description="JSON string representing the LastEvaluatedKey for pagination"
+    ),
 ) -> CollectionsListResponse:
     """
     Retrieves a list of collections, optionally filtered by their assessment status.
 
+    Without a limit every matching collection is returned. With a limit a single page
+    is read and its `last_evaluated_key` can be passed back to fetch the next page.
+
     Args:
         filter_status (Optional[AssessmentStatus]): Filter collections by status (e.g., PENDING, COMPLETED).
+        limit (Optional[int]): Maximum number of collections to read for this page.
+        last_evaluated_key (Optional[str]): The cursor returned with the previous page.
 
     Returns:
         CollectionsListResponse: A response object containing a list of collections matching the criteria.
     """
-    return await list_collections_impl(filter_status=filter_status)
+    return await list_collections_impl(
+        filter_status=filter_status,
+        limit=limit,
+        last_evaluated_key=last_evaluated_key,
+    )
+
+
+@router.get("/stream")
+async def stream_collections(
+    filter_status: Optional[AssessmentStatus] = Query(  # noqa: B008
+        None, alias="status", description="Filter collections by status"
+    ),
+) -> StreamingResponse:
+    """
+    Streams collections as newline-delimited JSON, optionally filtered by status.
+
+    Collections are sent as each page of the table is read, so clients can start
+    consuming large tables before the whole scan completes.
+
+    Args:
+        filter_status (Optional[AssessmentStatus]): Filter collections by status (e.g., PENDING, COMPLETED).
+
+    Returns:
+        StreamingResponse: An application/x-ndjson stream of Collection objects.
+    """
+    return StreamingResponse(
+        await stream_collections_impl(filter_status=filter_status),
+        media_type="application/x-ndjson",
+    )
 
 
 @router.get("/address-autocomplete", response_model=AddressAutocompleteResponse)
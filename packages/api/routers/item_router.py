@@ -1,8 +1,11 @@
-from typing import List
-from fastapi import APIRouter, HTTPException, status
-from constants import AWS_REGION, STORAGE_BUCKET_NAME
-from .methods.item_description_filter_label_test import item_label_filter_rule_test
+import asyncio
+from typing import List, Optional
+from botocore.exceptions import BotoCoreError
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from constants import STORAGE_BUCKET_NAME
 from schemas.datamodel import Item
+from utils.s3_helpers import presign_s3_download_url
 from schemas.requests_responses import (
     GenerateUploadUrlsRequest,
     GenerateUploadUrlsResponse,
@@ -17,31 +20,66 @@ from schemas.requests_responses import (
 
 # Import the implementation functions from the method files
 from .methods.get_items import get_items as get_items_impl
+from .methods.get_items import stream_items as stream_items_impl
 from .methods.create_item import create_item as create_item_impl
 from .methods.get_item import get_item as get_item_impl
 from .methods.update_item import update_item as update_item_impl
 from .methods.delete_item import delete_item as delete_item_impl
-from .methods.generate_upload_urls import ClientError, generate_upload_urls_impl
-from .methods.item_description_filter_prompt_test import (
-    item_description_filter_prompt_test as item_description_filter_prompt_test_impl,
-)
-import boto3
-from botocore.client import Config
+from .methods.generate_upload_urls import generate_upload_urls_impl
 
 # Main router for Item operations
 router = APIRouter()
 
+# Download URLs are restricted to this prefix to avoid leaking other bucket objects
+_TEMP_UPLOADS_PREFIX = "temp-uploads/"
+
+
+def _presign_downloads(s3_keys: List[str], expiration: int) -> List[str]:
+    """Signs a GET URL for each key; runs off the event loop as signing is CPU-bound."""
+    return [
+        presign_s3_download_url(STORAGE_BUCKET_NAME, s3_key, expiration)
+        for s3_key in s3_keys
+    ]
+
 
 # Define routes directly, calling the imported implementation functions
 @router.get("/", response_model=ItemListResponse)
-async def get_items() -> ItemListResponse:
+async def get_items(
+    limit: Optional[int] = Query(  # noqa: B008
+        None, description="Read a single page of at most this many Items", ge=1, le=1000
+    ),
+    last_evaluated_key: Optional[str] = Query(  # noqa: B008
+        None, description="JSON string representing the LastEvaluatedKey for pagination"
+    ),
+) -> ItemListResponse:
     """
     Retrieves a list of all Items.
 
+    Without a limit every Item is returned. With a limit a single page is read and
+    its `last_evaluated_key` can be passed back to fetch the next page.
+
+    Args:
+        limit (Optional[int]): Maximum number of Items to read for this page.
+        last_evaluated_key (Optional[str]): The cursor returned with the previous page.
+
     Returns:
         ItemListResponse: A response object containing a list of Items.
     """
-    return await get_items_impl()
+    return await get_items_impl(limit=limit, last_evaluated_key=last_evaluated_key)
+
+
+@router.get("/stream")
+async def stream_items() -> StreamingResponse:
+    """
+    Streams all Items as newline-delimited JSON, one Item per line.
+
+    Items are sent as each page of the table is read, so clients can start
+    consuming large tables before the whole scan completes.
+
+    Returns:
+        StreamingResponse: An application/x-ndjson stream of Item objects.
+    """
+    return StreamingResponse(await stream_items_impl(), media_type="application/x-ndjson")
 
 
 @router.post("/", response_model=Item, status_code=status.HTTP_201_CREATED)
@@ -90,32 +128,19 @@ async def generate_download_url(s3_keys: List[str]) -> List[str]:
     Returns:
         List[str]: A list of pre-signed URLs corresponding to the provided S3 keys.
     """
-    s3_client = boto3.client(
-        "s3",
-        region_name=AWS_REGION,
-        config=Config(signature_version="s3v4"),
-    )
     expiration = 3600  # Link expiration time in seconds (e.g., 1 hour)
-    urls = []
-    for s3_key in s3_keys:
-        # Prevent leaking of other objects in the same bucket
-        if not s3_key.startswith("temp-uploads/"):
-            s3_key = "temp-uploads/" + s3_key
-        try:
-            url = s3_client.generate_presigned_url(
-                "get_object",
-                Params={"Bucket": STORAGE_BUCKET_NAME, "Key": s3_key},
-                ExpiresIn=expiration,
-                HttpMethod="GET",
-            )
-            urls.append(url)
-        except ClientError as e:
-            # Handle error (e.g., log it, raise an exception, etc.)
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
-            ) from e
-
-    return urls
+    # Prevent leaking of other objects in the same bucket
+    prefixed_keys = [
+        k if k.startswith(_TEMP_UPLOADS_PREFIX) else _TEMP_UPLOADS_PREFIX + k
+        for k in s3_keys
+    ]
+    try:
+        return await asyncio.to_thread(_presign_downloads, prefixed_keys, expiration)
+    except BotoCoreError as e:
+        # Signing fails locally, e.g. when no credentials are available
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        ) from e
 
 
 @router.get("/{item_id}", response_model=Item)
@@ -147,6 +172,11 @@ async def item_description_filter_prompt_test(
         TestDescriptionFilterPromptResponse: The response indicating whether the description
                                                 passes the filter based on the prompt test.
     """
+    # Imported lazily so the LLM/agent stack is only loaded when this route is hit
+    from .methods.item_description_filter_prompt_test import (
+        item_description_filter_prompt_test as item_description_filter_prompt_test_impl,
+    )
+
     return await item_description_filter_prompt_test_impl(request)
 
 
@@ -165,6 +195,11 @@ async def item_label_filtering_rule_test(
         TestLabelFilteringRuleResponse: The response indicating whether the description
                                                 passes the filter based on the label test.
     """
+    # Imported lazily so the Rekognition/agent stack is only loaded when this route is hit
+    from .methods.item_description_filter_label_test import (
+        item_label_filter_rule_test,
+    )
+
     return await item_label_filter_rule_test(request)
 
 
@@ -1,19 +1,145 @@
+import logging
+import asyncio
+import threading
 import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+from cachetools import TTLCache
 from fastapi import HTTPException, status
 from botocore.exceptions import ClientError
 from boto3.dynamodb.conditions import Attr
 
+from aws_clients import s3_client
+
 # Import necessary models and utils
 from .collection_utils import (
     collections_table,
-    s3_client,
     dynamodb_item_to_collection,
     model_to_dynamodb_item,
 )
-from constants import STORAGE_BUCKET_NAME  # Import constant directly
-from schemas.datamodel import CollectionFile
+from constants import (
+    STORAGE_BUCKET_NAME,
+    S3_HEAD_CACHE_MAX_SIZE,
+    S3_HEAD_CACHE_TTL_SECONDS,
+)
+from schemas.datamodel import Collection, CollectionFile
 from schemas.requests_responses import AddFileRequest, AddFileResponse
 
+logger = logging.getLogger(__name__)
+
+# Cache of s3_key -> (ContentLength, ETag) so repeated adds of the same object skip HEAD
+_head_cache: TTLCache = TTLCache(
+    maxsize=S3_HEAD_CACHE_MAX_SIZE, ttl=S3_HEAD_CACHE_TTL_SECONDS
+)
+# TTLCache is not thread-safe and lookups run in worker threads
+_head_cache_lock = threading.Lock()
+# Objects under this prefix are overwritten in place, so their metadata is never cached
+_UNCACHED_PREFIX = "temp-uploads/"
+
+# Collections stored without a files attribute start from an empty list
+_UPDATE_EXPR = (
+    "SET #files = list_append(if_not_exists(#files, :empty_list), :new_file), "
+    "#updated_at = :updated_at"
+)
+_EAN = {"#files": "files", "#updated_at": "updated_at"}
+_COLLECTION_EXISTS = Attr("id").exists()
+
+
+def _head_object_cached(s3_key: str) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Returns the (ContentLength, ETag) of an S3 object, using the TTL cache when possible.
+    """
+    with _head_cache_lock:
+        cached = _head_cache.get(s3_key)
+    if cached is not None:
+        return cached
+
+    try:
+        head_response = s3_client.head_object(Bucket=STORAGE_BUCKET_NAME, Key=s3_key)
+    except ClientError:
+        with _head_cache_lock:
+            _head_cache.pop(s3_key, None)
+        raise
+
+    metadata = (head_response.get("ContentLength"), head_response.get("ETag"))
+    if not s3_key.startswith(_UNCACHED_PREFIX):
+        with _head_cache_lock:
+            _head_cache[s3_key] = metadata
+    return metadata
+
+
+class AddFileBatcher:
+    """
+    Coalesces concurrent file additions to the same collection into one UpdateItem.
+
+    The first add for an idle collection is written immediately. Adds that arrive
+    while that write is in flight are queued and appended together in the next
+    write, so bursts of uploads cost one round trip per batch rather than per file.
+    Every caller in a batch receives the same updated Collection (or exception).
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, List[Tuple[Dict[str, Any], int, asyncio.Future]]] = {}
+        self._active: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def add(
+        self, collection_id: str, new_file_item: Dict[str, Any], updated_at: int
+    ) -> Collection:
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(collection_id, []).append(
+            (new_file_item, updated_at, future)
+        )
+        if collection_id not in self._active:
+            self._active.add(collection_id)
+            task = asyncio.create_task(self._drain(collection_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return await future
+
+    async def _drain(self, collection_id: str) -> None:
+        try:
+            while self._pending.get(collection_id):
+                batch = self._pending.pop(collection_id)
+                await self._write(collection_id, batch)
+        finally:
+            self._active.discard(collection_id)
+
+    async def _write(
+        self,
+        collection_id: str,
+        batch: List[Tuple[Dict[str, Any], int, asyncio.Future]],
+    ) -> None:
+        try:
+            response = await asyncio.to_thread(
+                collections_table.update_item,
+                Key={"id": collection_id},
+                UpdateExpression=_UPDATE_EXPR,
+                ExpressionAttributeNames=_EAN,
+                ExpressionAttributeValues={
+                    ":empty_list": [],
+                    ":new_file": [file_item for file_item, _, _ in batch],
+                    ":updated_at": max(updated_at for _, updated_at, _ in batch),
+                },
+                # AddFileResponse carries the whole collection, and the files list that
+                # UPDATED_NEW would return is most of the item, so ALL_NEW is the cheaper
+                # option; the batcher already limits this to one echo per batch
+                ReturnValues="ALL_NEW",
+                ConditionExpression=_COLLECTION_EXISTS,
+            )
+            result: Any = dynamodb_item_to_collection(response["Attributes"])
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for _, _, future in batch:
+            if not future.done():
+                future.set_result(result)
+
+
+_add_file_batcher = AddFileBatcher()
+
 
 async def add_file_to_collection(
     collection_id: str, file_data: AddFileRequest
@@ -22,62 +148,59 @@ async def add_file_to_collection(
     Implementation to add a file to a collection after it has been uploaded to S3.
     """
     current_time = int(time.time())
-    file_size = None
+    file_size = file_data.size
 
-    # Fetch file size from S3
-    if file_data.s3_key:
+    # Fetch file size from S3 unless the client already supplied it
+    if file_size is None and file_data.s3_key:
         try:
-            head_response = s3_client.head_object(
-                Bucket=STORAGE_BUCKET_NAME, Key=file_data.s3_key
+            file_size, _ = await asyncio.to_thread(
+                _head_object_cached, file_data.s3_key
             )
-            file_size = head_response.get("ContentLength")
         except ClientError as e:
-            print(
-                f"Warning: Could not retrieve metadata for S3 key {file_data.s3_key} when adding file to Collection {collection_id}. Error: {e}"
+            logger.warning(
+                "Could not retrieve metadata for S3 key %s when adding file to Collection %s: %s",
+                file_data.s3_key,
+                collection_id,
+                e,
             )
-        except Exception as e:
-            print(
-                f"Warning: Unexpected error retrieving metadata for S3 key {file_data.s3_key} for Collection {collection_id}. Error: {e}"
+        except Exception:
+            logger.warning(
+                "Unexpected error retrieving metadata for S3 key %s for Collection %s",
+                file_data.s3_key,
+                collection_id,
+                exc_info=True,
             )
-    else:
-        print(
-            f"Warning: No s3_key provided in AddFileRequest for Collection {collection_id}. Cannot fetch size."
+    elif file_size is None:
+        logger.warning(
+            "No s3_key provided in AddFileRequest for Collection %s; cannot fetch size",
+            collection_id,
         )
 
     # Create CollectionFile object
-    collection_file = CollectionFile(**file_data.model_dump(), size=file_size)
+    collection_file = CollectionFile(
+        **file_data.model_dump(exclude={"size"}), size=file_size
+    )
     new_file_item = model_to_dynamodb_item(collection_file)
 
     try:
-        # Update DynamoDB item
-        response = collections_table.update_item(
-            Key={"id": collection_id},
-            UpdateExpression="SET #files = list_append(if_not_exists(#files, :empty_list), :new_file), #updated_at = :updated_at",
-            ExpressionAttributeNames={"#files": "files", "#updated_at": "updated_at"},
-            ExpressionAttributeValues={
-                ":new_file": [new_file_item],
-                ":empty_list": [],
-                ":updated_at": current_time,
-            },
-            ReturnValues="ALL_NEW",
-            ConditionExpression=Attr("id").exists(),
+        # Update DynamoDB item, batched with any concurrent adds to this collection
+        updated_collection = await _add_file_batcher.add(
+            collection_id, new_file_item, current_time
         )
-        updated_collection = dynamodb_item_to_collection(response["Attributes"])
         return AddFileResponse(collection=updated_collection)
 
     except ClientError as e:
-        print(f"Error adding file to collection {collection_id}: {e}")
         if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found"
             ) from e
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to add file to collection: {e.response['Error']['Message']}",
-            ) from e
+        logger.exception("Error adding file to collection %s", collection_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to add file to collection: {e.response['Error']['Message']}",
+        ) from e
     except Exception as e:
-        print(f"Unexpected error adding file to collection {collection_id}: {e}")
+        logger.exception("Unexpected error adding file to collection %s", collection_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}",
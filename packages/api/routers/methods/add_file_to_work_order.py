@@ -3,10 +3,11 @@ from fastapi import HTTPException, status
 from botocore.exceptions import ClientError
 from boto3.dynamodb.conditions import Attr
 
+from aws_clients import s3_client
+
 # Import necessary models and utils
 from .collection_utils import (
     collections_table,
-    s3_client,
     dynamodb_item_to_collection,
     model_to_dynamodb_item,
 )
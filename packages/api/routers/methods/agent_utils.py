@@ -1,13 +1,60 @@
-import boto3
-from typing import List, Dict, Any
-from constants import AWS_REGION, AGENTS_TABLE_NAME
+import threading
+from typing import List, Dict, Any, Optional
+from cachetools import TTLCache
+from aws_clients import dynamodb
+from constants import AGENTS_TABLE_NAME
 from schemas.datamodel import Agent, AgentTypes
 from .collection_utils import model_to_dynamodb_item
 
 # Initialize DynamoDB
-dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
 agent_table = dynamodb.Table(AGENTS_TABLE_NAME)
 
+# Agents change rarely, so reads are served from short-lived in-process caches.
+# Cached agents are shared across requests, so they are only stored and handed
+# out as copies through the helpers below
+agent_cache: TTLCache = TTLCache(maxsize=256, ttl=30)
+agent_list_cache: TTLCache = TTLCache(maxsize=1, ttl=15)
+AGENT_LIST_CACHE_KEY = "all"
+# TTLCache is not thread-safe and agents are also read from worker threads
+agent_cache_lock = threading.Lock()
+
+
+def invalidate_agent_cache(agent_id: str) -> None:
+    """Drops a changed agent, and the cached agent list, from the read caches."""
+    with agent_cache_lock:
+        agent_cache.pop(agent_id, None)
+        agent_list_cache.clear()
+
+
+def get_cached_agent(agent_id: str) -> Optional[Agent]:
+    """Returns a copy of the cached agent, or None if it isn't cached."""
+    with agent_cache_lock:
+        cached = agent_cache.get(agent_id)
+    return cached.model_copy(deep=True) if cached is not None else None
+
+
+def cache_agent(agent: Agent) -> None:
+    """Caches a copy of the agent, so later changes to it don't reach the cache."""
+    with agent_cache_lock:
+        agent_cache[agent.id] = agent.model_copy(deep=True)
+
+
+def get_cached_agent_list() -> Optional[List[Agent]]:
+    """Returns copies of the cached agent list, or None if it isn't cached."""
+    with agent_cache_lock:
+        cached = agent_list_cache.get(AGENT_LIST_CACHE_KEY)
+    if cached is None:
+        return None
+    return [agent.model_copy(deep=True) for agent in cached]
+
+
+def cache_agent_list(agents: List[Agent]) -> None:
+    """Caches copies of the full agent list."""
+    with agent_cache_lock:
+        agent_list_cache[AGENT_LIST_CACHE_KEY] = [
+            agent.model_copy(deep=True) for agent in agents
+        ]
+
 
 def dynamodb_item_to_agent(item: Dict[str, Any]) -> Agent:
     """
@@ -60,12 +107,20 @@ def get_agents_by_name(agent_name: str) -> List[Agent]:
     Returns:
         List[Agent]: List of retrieved agent objects
     """
-    from boto3.dynamodb.conditions import Attr
-
-    # Use scan with filter expression to find agents by name
-    response = agent_table.scan(FilterExpression=Attr("name").eq(agent_name))
+    from boto3.dynamodb.conditions import Key
 
-    items = response.get("Items", [])
+    # Query the name GSI, following pagination to collect every match
+    query_kwargs: Dict[str, Any] = {
+        "IndexName": "name-index",
+        "KeyConditionExpression": Key("name").eq(agent_name),
+    }
+    items: List[Dict[str, Any]] = []
+    while True:
+        response = agent_table.query(**query_kwargs)
+        items.extend(response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            break
+        query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
 
     # Convert all matching items to Agent objects
     agent_objects = []
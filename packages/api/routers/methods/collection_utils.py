@@ -1,9 +1,26 @@
-import boto3
+import asyncio
+import json
+import logging
+import random
 from decimal import Decimal
-from typing import Any, Type, cast
-from pydantic import BaseModel
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
+from pydantic import BaseModel, TypeAdapter
 from enum import Enum
-from botocore.client import Config
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+from fastapi import HTTPException, status
 
 # Import necessary models and constants from the main project structure
 from schemas.datamodel import (
@@ -11,8 +28,8 @@ from schemas.datamodel import (
     Item,
     CollectionFileStatus,
 )
+from aws_clients import dynamodb, dynamodb_client
 from constants import (
-    AWS_REGION,
     COLLECTIONS_TABLE_NAME,
     ITEMS_TABLE_NAME,
     VERIFICATION_JOBS_TABLE_NAME,
@@ -20,118 +37,528 @@ from constants import (
 # Import map utils if they are used by methods extracted here (or keep in methods files)
 # from utils.map import get_address_suggestions, get_coordinates_from_address
 
+logger = logging.getLogger(__name__)
+
 # Initialize AWS clients
-dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
 collections_table = dynamodb.Table(COLLECTIONS_TABLE_NAME)
 items_table = dynamodb.Table(ITEMS_TABLE_NAME)
 verification_jobs_table = dynamodb.Table(VERIFICATION_JOBS_TABLE_NAME)
-s3_client = boto3.client("s3", config=Config(signature_version="s3v4"))
+_type_serializer = TypeSerializer()
+_type_deserializer = TypeDeserializer()
 
-# --- Helper Functions for DynamoDB <-> Pydantic Conversion ---
+# DynamoDB caps BatchGetItem requests at 100 keys
+BATCH_GET_MAX_KEYS = 100
+
+
+class AIMDLimiter:
+    """
+    Caps concurrent BatchGetItem calls, adapting the cap like TCP congestion control.
+
+    The limit is cut multiplicatively when DynamoDB throttles and raised by one
+    after a run of successful calls, so concurrent requests back off together
+    and then recover gradually instead of retrying in lockstep.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        minimum: int = 1,
+        maximum: int = 32,
+        beta: float = 0.5,
+        alpha: int = 1,
+        increase_after: int = 8,
+    ):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.beta = beta
+        self.alpha = alpha
+        self.increase_after = increase_after
+        self._in_flight = 0
+        self._successes = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        # A Condition binds to the loop that first waits on it, so one is created
+        # per running loop rather than at import time
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self._in_flight = 0
+        return self._condition
+
+    async def __aenter__(self) -> "AIMDLimiter":
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight -= 1
+            condition.notify_all()
+
+    def on_throttle(self) -> None:
+        self._successes = 0
+        self.limit = max(self.minimum, int(self.limit * self.beta))
+
+    def on_ok(self) -> None:
+        self._successes += 1
+        if self._successes >= self.increase_after:
+            self._successes = 0
+            self.limit = min(self.maximum, self.limit + self.alpha)
+
+
+# Shared by every BatchGetItem caller, so throttling seen by one slows them all
+batch_get_limiter = AIMDLimiter()
+
+# Full-jitter backoff bounds for retrying throttled BatchGetItem keys, in seconds
+BATCH_GET_BACKOFF_BASE_SECONDS = 0.05
+BATCH_GET_BACKOFF_CAP_SECONDS = 5
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff, so throttled callers don't retry in sync."""
+    ceiling = BATCH_GET_BACKOFF_BASE_SECONDS * (2**attempt)
+    return random.uniform(0, min(BATCH_GET_BACKOFF_CAP_SECONDS, ceiling))
+
+
+async def _batch_get_chunk(
+    table_name: str,
+    keys: List[Dict[str, Any]],
+    max_retries: int,
+    projection: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """Fetches a single chunk of at most 100 keys, retrying unprocessed keys."""
+    items: List[Dict[str, Any]] = []
+    pending = keys
+    for attempt in range(max_retries):
+        try:
+            # Only the call itself holds a slot, so callers sleeping through a
+            # backoff don't keep others waiting
+            async with batch_get_limiter:
+                response = await asyncio.to_thread(
+                    dynamodb.batch_get_item,
+                    RequestItems={table_name: {"Keys": pending, **projection}},
+                )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ProvisionedThroughputExceededException":
+                raise
+            batch_get_limiter.on_throttle()
+        else:
+            items.extend(response.get("Responses", {}).get(table_name, []))
+            pending = (
+                response.get("UnprocessedKeys", {}).get(table_name, {}).get("Keys", [])
+            )
+            if not pending:
+                batch_get_limiter.on_ok()
+                return items
+            # Unprocessed keys are how BatchGetItem reports running out of throughput
+            batch_get_limiter.on_throttle()
+        await asyncio.sleep(_backoff_delay(attempt))
+    raise RuntimeError(
+        f"Failed to fetch {len(pending)} keys from {table_name} after {max_retries} attempts"
+    )
+
+
+async def batch_get_items(
+    table_name: str,
+    keys: List[Dict[str, Any]],
+    max_retries: int = 5,
+    projection_expression: Optional[str] = None,
+    expression_attribute_names: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetches items by primary key using BatchGetItem in chunks of 100 keys.
+
+    Chunks are requested concurrently under the shared AIMD limiter, and throttled
+    or unprocessed keys are retried with jittered exponential backoff. Duplicate
+    keys are dropped, as DynamoDB rejects batches containing them. Keys that do
+    not exist are simply absent from the result, which is returned in no
+    particular order.
+
+    Raises:
+        RuntimeError: If some keys are still unprocessed after max_retries attempts.
+    """
+    keys = list({tuple(sorted(key.items())): key for key in keys}.values())
+    projection: Dict[str, Any] = {}
+    if projection_expression:
+        projection["ProjectionExpression"] = projection_expression
+    if expression_attribute_names:
+        projection["ExpressionAttributeNames"] = expression_attribute_names
+
+    chunks = await asyncio.gather(
+        *(
+            _batch_get_chunk(
+                table_name, keys[i : i + BATCH_GET_MAX_KEYS], max_retries, projection
+            )
+            for i in range(0, len(keys), BATCH_GET_MAX_KEYS)
+        )
+    )
+    return [item for chunk in chunks for item in chunk]
+
+
+# Segments per parallel scan; each pages through its own slice of the table
+SCAN_TOTAL_SEGMENTS = 8
+
+
+def _scan_segment(
+    table: Any, segment: int, total_segments: int, scan_kwargs: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Pages through one segment of a parallel scan."""
+    segment_kwargs = {**scan_kwargs, "Segment": segment, "TotalSegments": total_segments}
+    items: List[Dict[str, Any]] = []
+    while True:
+        response = table.scan(**segment_kwargs)
+        items.extend(response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            return items
+        segment_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+async def parallel_scan(
+    table: Any, total_segments: int = SCAN_TOTAL_SEGMENTS, **scan_kwargs: Any
+) -> List[Dict[str, Any]]:
+    """
+    Scans a whole table as concurrent segments, each paginated in a worker thread.
+
+    Extra keyword arguments (e.g. FilterExpression) are passed to every segment's
+    scan. Items are returned in no particular order.
+    """
+    segments = await asyncio.gather(
+        *(
+            asyncio.to_thread(_scan_segment, table, segment, total_segments, scan_kwargs)
+            for segment in range(total_segments)
+        )
+    )
+    return [item for segment_items in segments for item in segment_items]
+
+
+async def scan_page(
+    table: Any,
+    limit: int,
+    exclusive_start_key: Optional[Dict[str, Any]] = None,
+    **scan_kwargs: Any,
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Reads a single scan page of at most `limit` evaluated items.
+
+    Returns the page's items and the LastEvaluatedKey to resume from, which is
+    None once the table is exhausted. With a FilterExpression the page can hold
+    fewer than `limit` items even when more remain.
+    """
+    scan_kwargs["Limit"] = limit
+    if exclusive_start_key:
+        scan_kwargs["ExclusiveStartKey"] = exclusive_start_key
+    response = await asyncio.to_thread(table.scan, **scan_kwargs)
+    return response.get("Items", []), response.get("LastEvaluatedKey")
+
+
+def parse_last_evaluated_key(value: str) -> Dict[str, Any]:
+    """
+    Parses a pagination cursor returned as last_evaluated_key by a list endpoint.
+
+    Raises:
+        ValueError: If the value is not a JSON object.
+    """
+    key = json.loads(value)
+    if not isinstance(key, dict):
+        raise ValueError("last_evaluated_key must be a JSON object")
+    return key
+
+
+# Items read per page when streaming a scan
+SCAN_PAGE_SIZE = 500
+
+
+async def scan_pages(
+    table: Any, page_size: int = SCAN_PAGE_SIZE, **scan_kwargs: Any
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Yields a table scan one page at a time, fetching each page in a worker thread.
+
+    Only the current page is held in memory, so callers can stream results out
+    while later pages are still being read.
+    """
+    scan_kwargs["Limit"] = page_size
+    while True:
+        response = await asyncio.to_thread(table.scan, **scan_kwargs)
+        yield response.get("Items", [])
+        if "LastEvaluatedKey" not in response:
+            return
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+async def start_ndjson_stream(
+    chunks: AsyncIterator[bytes], description: str
+) -> AsyncIterator[bytes]:
+    """
+    Reads the first chunk of an NDJSON stream before the response starts.
+
+    Failures on the first page therefore still become an HTTP 500. Once the 200
+    response has started, a later failure is logged and ends the body with an
+    {"error": ...} record instead of silently truncating it.
+    """
+    try:
+        first = await anext(chunks, None)
+    except ClientError as e:
+        logger.exception("Error streaming %s", description)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve {description}: {e.response['Error']['Message']}",
+        ) from e
+
+    async def remaining() -> AsyncIterator[bytes]:
+        if first is None:
+            return
+        yield first
+        try:
+            async for chunk in chunks:
+                yield chunk
+        except Exception:
+            logger.exception(
+                "Error streaming %s after the response started", description
+            )
+            yield (
+                json.dumps({"error": f"Failed to retrieve all {description}"}) + "\n"
+            ).encode()
+
+    return remaining()
+
+
+def to_attribute_values(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Serialises a plain DynamoDB item into low-level AttributeValue form."""
+    return {key: _type_serializer.serialize(value) for key, value in item.items()}
 
 
-# Helper function to recursively convert Python data structures (dicts, lists, primitives),
-# converting floats to Decimals for DynamoDB compatibility.
-def _recursive_float_to_decimal(data: Any) -> Any:
-    """Recursively traverses data structure, converting floats to Decimals."""
-    if isinstance(data, dict):
-        return {key: _recursive_float_to_decimal(value) for key, value in data.items()}
-    elif isinstance(data, list):
-        return [_recursive_float_to_decimal(item) for item in data]
-    elif isinstance(data, float):
-        return Decimal(str(data))
-    return data
+def from_attribute_values(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Deserialises a low-level AttributeValue item back into a plain DynamoDB item."""
+    deserialize = _type_deserializer.deserialize
+    return {key: deserialize(value) for key, value in item.items()}
+
+
+def put_collection_item(item_data: Dict[str, Any]) -> None:
+    """Writes a collection item through the low-level DynamoDB client."""
+    dynamodb_client.put_item(
+        TableName=COLLECTIONS_TABLE_NAME, Item=to_attribute_values(item_data)
+    )
+
+
+# --- Helper Functions for DynamoDB <-> Pydantic Conversion ---
 
 
 # Helper function to convert Pydantic model to DynamoDB item (generic)
 def model_to_dynamodb_item(model_instance: BaseModel) -> dict[str, Any]:
     """Converts a Pydantic model instance to a DynamoDB-compatible dictionary."""
-    item_dict = model_instance.model_dump(
-        mode="json", exclude_none=True
-    )  # Use exclude_none
-    print(item_dict)
-    # Cast the result of the recursive helper
-    return cast(dict[str, Any], _recursive_float_to_decimal(item_dict))
+    # Serialise with Pydantic's native JSON encoder and parse floats straight into
+    # Decimals, so the whole tree is converted without a Python-level walk
+    return cast(
+        dict[str, Any],
+        json.loads(
+            model_instance.model_dump_json(exclude_none=True), parse_float=Decimal
+        ),
+    )
 
 
-# Helper function to convert DynamoDB item to a Pydantic model (generic)
-def dynamodb_item_to_model(item: dict, model_class: Type[BaseModel]) -> BaseModel:
-    """Converts a DynamoDB item to a specific Pydantic model instance."""
-    processed_item = {}
-
-    # Recursively convert Decimals back to float/int
-    def parse_decimal(value: Any) -> Any:
-        if isinstance(value, list):
-            return [parse_decimal(v) for v in value]
-        elif isinstance(value, dict):
-            return {k: parse_decimal(v) for k, v in value.items()}
-        elif isinstance(value, Decimal):
-            if value % 1 == 0:
-                return int(value)
-            else:
-                return float(value)
-        return value
-
-    item = parse_decimal(item)
-
-    # Process fields based on model definition
-    for key, value in item.items():
-        if key not in model_class.model_fields:
-            processed_item[key] = value  # Keep extra fields if any
-            continue
-
-        field_info = model_class.model_fields[key]
+# Per-field conversion plan entry: ("enum", EnumClass), ("list_model", ModelClass) or ("scalar", None)
+FieldPlan = Tuple[str, Optional[type]]
+
+
+@lru_cache(maxsize=None)
+def _conversion_plan(
+    model_class: Type[BaseModel],
+) -> Tuple[Dict[str, FieldPlan], FrozenSet[str]]:
+    """
+    Inspects a model's fields once and caches how each field should be converted.
+
+    Returns:
+        A mapping of field name to its conversion plan, and the names of list-typed fields.
+    """
+    field_plans: Dict[str, FieldPlan] = {}
+    list_fields = []
+    for field_name, field_info in model_class.model_fields.items():
         annotation = field_info.annotation
         origin_type = getattr(annotation, "__origin__", None)
         args = getattr(annotation, "__args__", [])
 
-        # Handle Enums
         if isinstance(annotation, type) and issubclass(annotation, Enum):
-            try:
-                processed_item[key] = annotation(value)
-            except ValueError:
-                print(
-                    f"Warning: Invalid enum value '{value}' for field '{key}' in {model_class.__name__} {item.get('id')}"
-                )
-                processed_item[key] = None  # Or default
-        # Handle Lists of Pydantic Models
+            field_plans[field_name] = ("enum", annotation)
         elif (
             origin_type is list
             and args
             and isinstance(args[0], type)
             and issubclass(args[0], BaseModel)
         ):
-            model_in_list = args[0]
-            # Ensure value is a list before iterating
-            if isinstance(value, list):
-                processed_item[key] = [
-                    dynamodb_item_to_model(i, model_in_list)
-                    for i in value
-                    if isinstance(i, dict)
-                ]
-            else:
-                print(
-                    f"Warning: Expected list for field '{key}' but got {type(value)}. Setting to empty list."
-                )
-                processed_item[key] = []
-        # Handle simple types or lists of simple types
+            field_plans[field_name] = ("list_model", args[0])
         else:
-            processed_item[key] = value
+            field_plans[field_name] = ("scalar", None)
 
-    # Ensure list fields expected by the model are present
-    for field_name, field_info in model_class.model_fields.items():
-        origin_type = getattr(field_info.annotation, "__origin__", None)
-        if origin_type is list and field_name not in processed_item:
+        if origin_type is list:
+            list_fields.append(field_name)
+
+    return field_plans, frozenset(list_fields)
+
+
+# Field converter signature: (value, source item) -> converted value
+FieldConverter = Callable[[Any, dict], Any]
+
+
+def _enum_field_converter(
+    model_class: Type[BaseModel], key: str, enum_class: Type[Enum]
+) -> FieldConverter:
+    def convert(value: Any, item: dict) -> Any:
+        try:
+            return enum_class(value)
+        except ValueError:
+            logger.warning(
+                "Invalid enum value %r for field '%s' in %s %s",
+                value,
+                key,
+                model_class.__name__,
+                item.get("id"),
+            )
+            return None  # Or default
+
+    return convert
+
+
+@lru_cache(maxsize=None)
+def _needs_python_conversion(model_class: Type[BaseModel]) -> bool:
+    """
+    Whether a model needs the Python-side converter, i.e. it has enum or
+    list-of-model fields, or list fields without a default.
+    """
+    field_plans, list_fields = _conversion_plan(model_class)
+    return any(kind != "scalar" for kind, _ in field_plans.values()) or any(
+        model_class.model_fields[name].is_required() for name in list_fields
+    )
+
+
+def _list_model_field_converter(
+    key: str, model_in_list: Type[BaseModel]
+) -> FieldConverter:
+    def convert(value: Any, item: dict) -> Any:
+        # Ensure value is a list before iterating
+        if not isinstance(value, list):
+            logger.warning(
+                "Expected list for field '%s' but got %s. Setting to empty list.",
+                key,
+                type(value),
+            )
+            return []
+        if not _needs_python_conversion(model_in_list):
+            # Plain models are left as dicts and validated by pydantic-core in one pass
+            return [parse_decimal(i) for i in value if isinstance(i, dict)]
+        nested_converter = _model_converter(model_in_list)
+        return [nested_converter(i) for i in value if isinstance(i, dict)]
+
+    return convert
+
+
+@lru_cache(maxsize=None)
+def _model_converter(model_class: Type[BaseModel]) -> Callable[[dict], BaseModel]:
+    """
+    Builds, once per model class, a converter specialised to that model's fields.
+
+    Only enum and list-of-model fields get a dedicated converter; every other field
+    (including extra attributes not on the model) only has its Decimals converted.
+    Each value in the item is therefore visited exactly once.
+    """
+    field_plans, list_fields = _conversion_plan(model_class)
+    field_converters: Dict[str, FieldConverter] = {}
+    for field_name, (kind, target) in field_plans.items():
+        if kind == "enum":
+            field_converters[field_name] = _enum_field_converter(
+                model_class, field_name, cast(Type[Enum], target)
+            )
+        elif kind == "list_model":
+            field_converters[field_name] = _list_model_field_converter(
+                field_name, cast(Type[BaseModel], target)
+            )
+
+    def convert(item: dict) -> BaseModel:
+        processed_item = {
+            key: field_converters[key](value, item)
+            if key in field_converters
+            else parse_decimal(value)
+            for key, value in item.items()
+        }
+
+        # Ensure list fields expected by the model are present
+        for field_name in list_fields - processed_item.keys():
             processed_item[field_name] = []
 
-    try:
-        return model_class.model_validate(processed_item)
-    except Exception as e:
-        print(
-            f"Error validating/creating model {model_class.__name__} from item {item.get('id')}: {e}"
-        )
-        print(f"Processed item data: {processed_item}")
-        raise
+        try:
+            return model_class.model_validate(processed_item)
+        except Exception:
+            logger.exception(
+                "Error validating/creating model %s from item %s",
+                model_class.__name__,
+                item.get("id"),
+            )
+            logger.debug("Processed item data: %s", processed_item)
+            raise
+
+    return convert
+
+
+# Recursively convert Decimals back to float/int
+def parse_decimal(value: Any) -> Any:
+    if isinstance(value, list):
+        return [parse_decimal(v) for v in value]
+    elif isinstance(value, dict):
+        return {k: parse_decimal(v) for k, v in value.items()}
+    elif isinstance(value, Decimal):
+        if value % 1 == 0:
+            return int(value)
+        else:
+            return float(value)
+    return value
+
+
+# Helper function to convert DynamoDB item to a Pydantic model (generic)
+def dynamodb_item_to_model(item: dict, model_class: Type[BaseModel]) -> BaseModel:
+    """Converts a DynamoDB item to a specific Pydantic model instance."""
+    return _model_converter(model_class)(item)
+
+
+@lru_cache(maxsize=None)
+def _validates_natively(model_class: Type[BaseModel]) -> bool:
+    """
+    Whether pydantic-core can validate the model straight from Decimal-converted
+    dicts, i.e. no model in its tree has enum fields or required list fields.
+    """
+    field_plans, list_fields = _conversion_plan(model_class)
+    if any(model_class.model_fields[name].is_required() for name in list_fields):
+        return False
+    return all(
+        kind == "scalar" or (kind == "list_model" and _validates_natively(target))
+        for kind, target in field_plans.values()
+    )
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_class: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model_class])  # type: ignore[valid-type]
+
+
+def dynamodb_items_to_models(
+    items: List[dict], model_class: Type[BaseModel]
+) -> List[BaseModel]:
+    """
+    Converts a page of DynamoDB items to Pydantic models.
+
+    Models without enum fields are validated in a single pydantic-core call for the
+    whole page; others go through the per-item converter.
+    """
+    if not _validates_natively(model_class):
+        converter = _model_converter(model_class)
+        return [converter(item) for item in items]
+    return _list_adapter(model_class).validate_python(parse_decimal(items))
 
 
 # Specific helper for Collection
@@ -147,8 +574,10 @@ def dynamodb_item_to_collection(item: dict) -> Collection:
                 try:
                     file_data["status"] = CollectionFileStatus(file_data["status"])
                 except ValueError:
-                    print(
-                        f"Warning: Invalid CollectionFileStatus value '{file_data['status']}' for file {file_data.get('id')}"
+                    logger.warning(
+                        "Invalid CollectionFileStatus value %r for file %s",
+                        file_data["status"],
+                        file_data.get("id"),
                     )
                     file_data["status"] = None  # Or default
     # Cast the result to the specific Pydantic model type
@@ -161,6 +590,23 @@ def dynamodb_item_to_item(item: dict) -> Item:
     return cast(Item, dynamodb_item_to_model(item, Item))
 
 
+def dynamodb_items_to_items(items: List[dict]) -> List[Item]:
+    return cast(List[Item], dynamodb_items_to_models(items, Item))
+
+
 # Specific helper for Collection to DynamoDB (if needed, otherwise generic is fine)
 def collection_to_dynamodb_item(collection: Collection) -> dict:
     return model_to_dynamodb_item(collection)
+
+
+# Bulk write helper for Collections (BatchWriteItem, up to 25 puts per request)
+def bulk_create_collections(collections: List[Collection]) -> None:
+    """
+    Writes several collections at once using the table's batch writer.
+
+    boto3 groups the puts into BatchWriteItem calls of up to 25 items and
+    resubmits any UnprocessedItems automatically.
+    """
+    with collections_table.batch_writer(overwrite_by_pkeys=["id"]) as writer:
+        for collection in collections:
+            writer.put_item(Item=collection_to_dynamodb_item(collection))
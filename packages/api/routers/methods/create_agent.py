@@ -1,8 +1,9 @@
+import asyncio
 from fastapi import HTTPException, status
 from botocore.exceptions import ClientError
 from schemas.datamodel import Agent, AgentTypes
 from schemas.requests_responses import CreateAgentRequest
-from .agent_utils import agent_table, agent_to_dynamodb_item
+from .agent_utils import agent_table, agent_to_dynamodb_item, invalidate_agent_cache
 import time
 import uuid
 
@@ -43,8 +44,9 @@ async def create_agent(agent_request: CreateAgentRequest) -> Agent:
     # Insert the agent into the database
     try:
         item = agent_to_dynamodb_item(agent)
-        agent_table.put_item(Item=item)
-        
+        await asyncio.to_thread(agent_table.put_item, Item=item)
+        invalidate_agent_cache(agent_id)
+
         return agent
         
     except ClientError as e:
@@ -1,18 +1,18 @@
+import logging
+import asyncio
 import uuid
 import time
 from fastapi import HTTPException, status
 from botocore.exceptions import ClientError
 
 # Import necessary models and utils
-from .collection_utils import (
-    collections_table,
-    items_table,
-    dynamodb_item_to_item,
-    collection_to_dynamodb_item,
-)
+from .collection_utils import collection_to_dynamodb_item, put_collection_item
+from .item_utils import get_items_by_ids
 from schemas.datamodel import Collection
 from schemas.requests_responses import CreateCollectionRequest, CreateCollectionResponse
 
+logger = logging.getLogger(__name__)
+
 
 async def create_collection(
     collection_request: CreateCollectionRequest,
@@ -22,7 +22,6 @@ async def create_collection(
     """
     current_time = int(time.time())
     collection_id = str(uuid.uuid4())
-    fetched_items = []
     
     if not collection_request.item_ids or len(collection_request.item_ids) == 0:
         raise HTTPException(
@@ -30,37 +29,33 @@ async def create_collection(
             detail="At least one Item ID must be provided in the request.",
         )
 
-    if collection_request.item_ids:
-        for item_id in collection_request.item_ids:
-            try:
-                item_response = items_table.get_item(Key={"id": item_id})
-                item_item = item_response.get("Item")
-                if not item_item:
-                    print(
-                        f"Warning: Item with ID {item_id} not found. Skipping for Collection {collection_id}."
-                    )
-                    continue
-
-                item_data = dynamodb_item_to_item(item_item)
-                fetched_items.append(item_data)
+    # Fetch all requested Items in batches rather than one request per Item
+    try:
+        fetched_items = await get_items_by_ids(collection_request.item_ids)
+    except ClientError as e:
+        logger.exception("Error fetching Items for Collection %s", collection_id)
+        error_message = "Unknown error"
+        if hasattr(e, 'response') and e.response and 'Error' in e.response:
+            error_message = e.response['Error'].get('Message', 'Unknown error')
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch Item details: {error_message}",
+        ) from e
+    except Exception as e:
+        logger.exception("Error fetching Items for Collection %s", collection_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch Item details: {str(e)}",
+        ) from e
 
-            except ClientError as e:
-                print(f"Error fetching Item {item_id} for Collection {collection_id}: {e}")
-                error_message = "Unknown error"
-                if hasattr(e, 'response') and e.response and 'Error' in e.response:
-                    error_message = e.response['Error'].get('Message', 'Unknown error')
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to fetch Item details for ID {item_id}: {error_message}",
-                ) from e
-            except Exception as e:
-                print(
-                    f"Error processing Item {item_id} for Collection {collection_id}: {e}"
-                )
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to process Item details for ID {item_id}: {str(e)}",
-                ) from e
+    found_item_ids = {item.id for item in fetched_items}
+    for item_id in collection_request.item_ids:
+        if item_id not in found_item_ids:
+            logger.warning(
+                "Item with ID %s not found. Skipping for Collection %s",
+                item_id,
+                collection_id,
+            )
 
     collection = Collection(
         id=collection_id,
@@ -74,10 +69,10 @@ async def create_collection(
 
     try:
         item_data = collection_to_dynamodb_item(collection)
-        collections_table.put_item(Item=item_data)
+        await asyncio.to_thread(put_collection_item, item_data)
         return CreateCollectionResponse(collection=collection)
     except ClientError as e:
-        print(f"Error creating collection in DynamoDB: {e}")
+        logger.exception("Error creating collection %s in DynamoDB", collection_id)
         error_message = "Unknown error"
         if hasattr(e, 'response') and e.response and 'Error' in e.response:
             error_message = e.response['Error'].get('Message', 'Unknown error')
@@ -86,7 +81,7 @@ async def create_collection(
             detail=f"Failed to save collection: {error_message}",
         ) from e
     except Exception as e:
-        print(f"Unexpected error creating collection: {e}")
+        logger.exception("Unexpected error creating collection %s", collection_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred during collection creation: {str(e)}",
@@ -1,3 +1,4 @@
+import asyncio
 import time
 import uuid
 from fastapi import HTTPException, status
@@ -29,7 +30,7 @@ async def create_item(item_request: CreateItemRequest) -> Item:
 
     try:
         item_data = model_to_dynamodb_item(item)  # Use generic model converter
-        item_table.put_item(Item=item_data)
+        await asyncio.to_thread(item_table.put_item, Item=item_data)
         return item
     except ClientError as e:
         print(f"Error creating Item: {e}")  # Add logging
@@ -1,4 +1,9 @@
+import logging
+import asyncio
+import os
 import time
+import uuid
+from typing import List
 from fastapi import HTTPException, status
 from botocore.exceptions import ClientError
 import shortuuid
@@ -10,18 +15,36 @@ from .verification_job_utils import (
     dynamodb_item_to_collection,
     model_to_dynamodb_item,
     queue_verification_job,  # Import the helper
+    put_job_with_item_links,
+    MAX_LINKED_ITEMS_PER_JOB,
 )
 
 # STORAGE_BUCKET_NAME is used within _create_file_instances, no need to import here unless used elsewhere
 from schemas.datamodel import (
     VerificationJob,
     AssessmentStatus,
+    ItemInstance,
+    CollectionFileInstance,
 )
 from schemas.requests_responses import (
     CreateVerificationJobRequest,
     CreateVerificationJobResponse,
 )
 
+logger = logging.getLogger(__name__)
+
+# Attempts at finding an unused job ID before giving up
+JOB_ID_MAX_ATTEMPTS = 3
+
+
+def _bulk_short_ids(count: int) -> List[str]:
+    """Generates shortuuid-format IDs for a whole batch from a single urandom call."""
+    raw = os.urandom(16 * count)
+    return [
+        shortuuid.encode(uuid.UUID(bytes=raw[i : i + 16], version=4))
+        for i in range(0, 16 * count, 16)
+    ]
+
 
 async def create_verification_job(
     job_request: CreateVerificationJobRequest,
@@ -36,8 +59,8 @@ async def create_verification_job(
     try:
         # 1. Fetch the Collection
         try:
-            col_response = collections_table.get_item(
-                Key={"id": job_request.collection_id}
+            col_response = await asyncio.to_thread(
+                collections_table.get_item, Key={"id": job_request.collection_id}
             )
             collection_item = col_response.get("Item")
             if not collection_item:
@@ -47,71 +70,58 @@ async def create_verification_job(
                 )
             collection = dynamodb_item_to_collection(collection_item)
         except ClientError as e:
-            print(f"Error fetching collection {job_request.collection_id}: {e}")
+            logger.exception("Error fetching collection %s", job_request.collection_id)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to retrieve collection: {e.response['Error']['Message']}",
             ) from e
 
-        # Generate a unique job ID, ensuring it doesn't already exist
-        while True:
-            job_id = str(shortuuid.uuid())
-            try:
-                # Check if the ID already exists in the table
-                response = verification_jobs_table.get_item(
-                    Key={"id": job_id},
-                    ProjectionExpression="id",  # Only need to check existence, not fetch full item
-                )
-                if "Item" not in response:
-                    # ID is unique, break the loop
-                    break
-                # If Item exists, the loop continues to generate a new ID
-                print(f"Job ID {job_id} already exists, generating a new one.")
-            except ClientError as e:
-                print(f"Error checking job ID {job_id} existence: {e}")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to verify job ID uniqueness: {e.response['Error']['Message']}",
-                ) from e
-
-        # 2. Create ItemInstance objects from the collection's items
-        from schemas.datamodel import ItemInstance
-        item_instances = []
-        if collection.items:
-            for item in collection.items:
-                item_instance = ItemInstance(
-                    id=str(shortuuid.uuid()),
-                    created_at=current_time,
-                    updated_at=current_time,
-                    name=item.name,
-                    description=item.description,
-                    label_filtering_rules_applied=item.label_filtering_rules,
-                    description_filtering_rules_applied=item.description_filtering_rules,
-                    status=AssessmentStatus.PENDING,
-                    address=collection.address,
-                    item_id=item.id,  # Keep reference to original item
-                    cluster_number=item.cluster_number,
-                    agent_ids=item.agent_ids or [],
-                
-                )
-                item_instances.append(item_instance)
+        # Uniqueness is enforced by the conditional put below
+        job_id = str(shortuuid.uuid())
+
+        if len({item.id for item in collection.items or []}) > MAX_LINKED_ITEMS_PER_JOB:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"A verification job can use at most {MAX_LINKED_ITEMS_PER_JOB} Items",
+            )
+
+        # 2. Create ItemInstance objects from the collection's items. The source
+        # values come from an already validated Collection, so validation is skipped
+        collection_items = collection.items or []
+        item_instances = [
+            ItemInstance.model_construct(
+                id=instance_id,
+                created_at=current_time,
+                updated_at=current_time,
+                name=item.name,
+                description=item.description,
+                label_filtering_rules_applied=item.label_filtering_rules,
+                description_filtering_rules_applied=item.description_filtering_rules,
+                status=AssessmentStatus.PENDING,
+                address=collection.address,
+                item_id=item.id,  # Keep reference to original item
+                cluster_number=item.cluster_number,
+                agent_ids=item.agent_ids or [],
+            )
+            for item, instance_id in zip(
+                collection_items, _bulk_short_ids(len(collection_items))
+            )
+        ]
 
         # 3. Create CollectionFileInstance objects from the collection's files
-        from schemas.datamodel import CollectionFileInstance
-        file_instances = []
-        if collection.files:
-            for file in collection.files:
-                file_instance = CollectionFileInstance(
-                    id=file.id,
-                    created_at=file.created_at,
-                    s3_key=file.s3_key,
-                    description=file.description,
-                    content_type=file.content_type,
-                    filename=file.filename,
-                    size=file.size,
-                    file_checks=[]
-                )
-                file_instances.append(file_instance)
+        file_instances = [
+            CollectionFileInstance.model_construct(
+                id=file.id,
+                created_at=file.created_at,
+                s3_key=file.s3_key,
+                description=file.description,
+                content_type=file.content_type,
+                filename=file.filename,
+                size=file.size,
+                file_checks=[],
+            )
+            for file in collection.files or []
+        ]
 
         # 4. Create the initial VerificationJob object
         verification_job = VerificationJob(
@@ -126,34 +136,54 @@ async def create_verification_job(
             search_internet=job_request.search_internet,
         )
 
-        # 5. Save initial job data to DynamoDB
+        # 5. Save initial job data to DynamoDB, regenerating the ID if it is already taken
         item_data = model_to_dynamodb_item(verification_job)
-        verification_jobs_table.put_item(Item=item_data)
-
-        # 6. Queue the job for processing
-        queue_verification_job(job_id)
+        item_ids = [instance.item_id for instance in item_instances]
+        for attempt in range(JOB_ID_MAX_ATTEMPTS):
+            # The job and its Item links are written together, so an Item can never be
+            # deleted while a stored job references it and no link outlives a failed create
+            try:
+                await asyncio.to_thread(put_job_with_item_links, item_data, item_ids)
+                break
+            except ClientError as e:
+                reasons = e.response.get("CancellationReasons") or [{}]
+                if (
+                    reasons[0].get("Code") != "ConditionalCheckFailed"
+                    or attempt == JOB_ID_MAX_ATTEMPTS - 1
+                ):
+                    raise
+                logger.warning("Job ID %s already exists, generating a new one", job_id)
+                job_id = str(shortuuid.uuid())
+                verification_job.id = job_id
+                item_data["id"] = job_id
 
-        # 7. Update job status after queuing
+        # 6 & 7. Queue the job for processing while bumping its timestamp. The job
+        # must already exist when the processor picks up the message, so only the
+        # timestamp is rewritten here
         verification_job.updated_at = int(time.time())
-        updated_item_data = model_to_dynamodb_item(verification_job)
-        verification_jobs_table.put_item(Item=updated_item_data)
+        await asyncio.gather(
+            asyncio.to_thread(queue_verification_job, job_id),
+            asyncio.to_thread(
+                verification_jobs_table.update_item,
+                Key={"id": job_id},
+                UpdateExpression="SET updated_at = :t",
+                ExpressionAttributeValues={":t": verification_job.updated_at},
+            ),
+        )
 
         return CreateVerificationJobResponse(verification_job=verification_job)
 
     except HTTPException as e:  # Re-raise 404 or other HTTP errors
         raise e
     except ClientError as e:
-        error_source = e.response["Error"]["Code"]
         error_message = e.response["Error"]["Message"]
-        print(
-            f"AWS ClientError ({error_source}) creating verification job {job_id or 'unknown'}: {error_message}"
-        )
+        logger.exception("Error creating verification job %s", job_id or "unknown")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save verification job: {error_message}",
         ) from e
     except Exception as e:
-        print(f"Unexpected error creating verification job: {e}")
+        logger.exception("Unexpected error creating verification job")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}",
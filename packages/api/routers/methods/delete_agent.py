@@ -1,6 +1,8 @@
+import asyncio
 from fastapi import HTTPException, status
 from botocore.exceptions import ClientError
-from .agent_utils import agent_table
+from boto3.dynamodb.conditions import Attr
+from .agent_utils import agent_table, invalidate_agent_cache
 
 
 async def delete_agent(agent_id: str) -> None:
@@ -14,21 +16,22 @@ async def delete_agent(agent_id: str) -> None:
         None: Returns None with a 204 No Content status code upon successful deletion.
     """
     try:
-        # First, check if the agent exists
-        response = agent_table.get_item(Key={"id": agent_id})
-        
-        if "Item" not in response:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Agent with ID {agent_id} not found",
-            )
-        
-        # Delete the agent
-        agent_table.delete_item(Key={"id": agent_id})
+        # Delete the agent, failing the condition if it does not exist
+        await asyncio.to_thread(
+            agent_table.delete_item,
+            Key={"id": agent_id},
+            ConditionExpression=Attr("id").exists(),
+        )
+        invalidate_agent_cache(agent_id)
         
     except HTTPException:
         raise
     except ClientError as e:
+        if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Agent with ID {agent_id} not found",
+            ) from e
         print(f"Error deleting Agent {agent_id}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,22 +1,40 @@
+import asyncio
 from fastapi import HTTPException, status
 from botocore.exceptions import ClientError
 from boto3.dynamodb.conditions import Key, Attr
 
+from aws_clients import s3_client
+
 # Import necessary models and utils
-from .collection_utils import collections_table, verification_jobs_table, s3_client
+from .collection_utils import (
+    collections_table,
+    verification_jobs_table,
+)
 from constants import STORAGE_BUCKET_NAME  # Import constant directly
 
+# DeleteObjects accepts at most 1000 keys per request
+S3_DELETE_MAX_KEYS = 1000
+
 
 async def delete_collection(collection_id: str) -> None:
     """
     Implementation to delete a collection after checking for associated verification jobs and deleting S3 files.
     """
     try:
-        # 1. Check for associated verification jobs
-        verification_query_response = verification_jobs_table.query(
-            IndexName="CollectionIdIndex",  # Assumed GSI name
-            KeyConditionExpression=Key("collection_id").eq(collection_id),
-            Select="COUNT",
+        # 1 & 2. Check for associated verification jobs while fetching the S3 keys
+        verification_query_response, response = await asyncio.gather(
+            asyncio.to_thread(
+                verification_jobs_table.query,
+                IndexName="CollectionIdIndex",  # Assumed GSI name
+                KeyConditionExpression=Key("collection_id").eq(collection_id),
+                Select="COUNT",
+                Limit=1,  # Only existence matters, so stop at the first match
+            ),
+            asyncio.to_thread(
+                collections_table.get_item,
+                Key={"id": collection_id},
+                ProjectionExpression="files",
+            ),
         )
 
         if verification_query_response.get("Count", 0) > 0:
@@ -25,10 +43,6 @@ async def delete_collection(collection_id: str) -> None:
                 detail="Cannot delete collection: Associated verification jobs exist.",
             )
 
-        # 2. Get S3 keys for files to delete
-        response = collections_table.get_item(
-            Key={"id": collection_id}, ProjectionExpression="files"
-        )
         item = response.get("Item")
         objects_to_delete = []
         if item and "files" in item:
@@ -44,29 +58,42 @@ async def delete_collection(collection_id: str) -> None:
                     f"Warning: 'files' attribute for collection {collection_id} is not a list: {item.get('files')}"
                 )
 
-        # 3. Delete S3 files if any exist
+        # 3. Delete S3 files if any exist, in concurrent batches of up to 1000 keys
         if objects_to_delete:
             print(
                 f"Attempting to delete {len(objects_to_delete)} S3 objects for collection {collection_id}."
             )
-            try:
-                delete_response = s3_client.delete_objects(
-                    Bucket=STORAGE_BUCKET_NAME,
-                    Delete={"Objects": objects_to_delete, "Quiet": True},
-                )
-                if "Errors" in delete_response and delete_response["Errors"]:
+            delete_responses = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        s3_client.delete_objects,
+                        Bucket=STORAGE_BUCKET_NAME,
+                        Delete={
+                            "Objects": objects_to_delete[i : i + S3_DELETE_MAX_KEYS],
+                            "Quiet": True,
+                        },
+                    )
+                    for i in range(0, len(objects_to_delete), S3_DELETE_MAX_KEYS)
+                ),
+                return_exceptions=True,
+            )
+            for delete_response in delete_responses:
+                if isinstance(delete_response, ClientError):
+                    print(
+                        f"Error during S3 batch delete for collection {collection_id}: {delete_response}"
+                    )
+                    # Log and continue with DynamoDB deletion
+                elif isinstance(delete_response, BaseException):
+                    raise delete_response
+                elif delete_response.get("Errors"):
                     print(
                         f"Errors deleting S3 objects for collection {collection_id}: {delete_response['Errors']}"
                     )
                     # Log and continue with DynamoDB deletion
-            except ClientError as s3_error:
-                print(
-                    f"Error during S3 batch delete for collection {collection_id}: {s3_error}"
-                )
-                # Log and continue with DynamoDB deletion
 
         # 4. Delete the DynamoDB item
-        collections_table.delete_item(
+        await asyncio.to_thread(
+            collections_table.delete_item,
             Key={"id": collection_id},
             ConditionExpression=Attr("id").exists(),  # Ensure item exists
         )
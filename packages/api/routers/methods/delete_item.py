@@ -1,8 +1,9 @@
+import asyncio
 from fastapi import HTTPException, status
 from botocore.exceptions import ClientError
-from boto3.dynamodb.conditions import Attr
-from .item_utils import item_table, verification_job_table
-from constants import VERIFICATION_JOBS_TABLE_NAME  # Import constant directly
+from boto3.dynamodb.conditions import Attr, Key
+from .item_utils import item_table
+from .verification_job_utils import job_items_table
 
 
 async def delete_item(item_id: str) -> None:
@@ -11,32 +12,14 @@ async def delete_item(item_id: str) -> None:
     Prevents deletion if the Item is associated with any Verification Job.
     """
     try:
-        # Check if any VerificationJob uses this Item
-        paginator = verification_job_table.meta.client.get_paginator("scan")
-        scan_kwargs = {
-            "TableName": VERIFICATION_JOBS_TABLE_NAME,
-            "ProjectionExpression": "id, items",  # Only fetch necessary fields
-            "FilterExpression": "attribute_exists(items)",  # Optimization: only scan items that have items
-        }
-
-        item_in_use = False
-        for page in paginator.paginate(**scan_kwargs):
-            for item in page.get("Items", []):
-                # The 'items' attribute in DynamoDB is a list of maps (dictionaries)
-                item_instances = item.get("items", [])
-                if isinstance(item_instances, list):
-                    for item_instance_data in item_instances:
-                        # Ensure it's a dictionary and has 'item_id'
-                        if (
-                            isinstance(item_instance_data, dict)
-                            and item_instance_data.get("item_id") == item_id
-                        ):
-                            item_in_use = True
-                            break  # Found one, no need to check further in this item
-                if item_in_use:
-                    break  # Found one, no need to check further pages
-            if item_in_use:
-                break  # Exit outer loop as well
+        # Check if any VerificationJob uses this Item via the job items lookup table
+        response = await asyncio.to_thread(
+            job_items_table.query,
+            KeyConditionExpression=Key("item_id").eq(item_id),
+            Select="COUNT",
+            Limit=1,
+        )
+        item_in_use = response.get("Count", 0) > 0
 
         if item_in_use:
             raise HTTPException(
@@ -45,7 +28,8 @@ async def delete_item(item_id: str) -> None:
             )
 
         # If not in use, proceed with deletion
-        item_table.delete_item(
+        await asyncio.to_thread(
+            item_table.delete_item,
             Key={"id": item_id},
             ConditionExpression=Attr("id").exists(),  # Ensure item exists before delete
         )
@@ -1,8 +1,10 @@
+import asyncio
 from fastapi import HTTPException, status
 from botocore.exceptions import ClientError
+from boto3.dynamodb.conditions import Attr
 
 # Import necessary models and utils from the verification_job_utils
-from .verification_job_utils import verification_jobs_table
+from .verification_job_utils import verification_jobs_table, unlink_job_items
 
 
 async def delete_verification_job(verification_job_id: str) -> None:
@@ -10,18 +12,33 @@ async def delete_verification_job(verification_job_id: str) -> None:
     Implementation to delete a verification job
     """
     try:
-        # 1. Get the job details first to find the execution ARN
-        get_response = verification_jobs_table.get_item(Key={"id": verification_job_id})
-        item = get_response.get("Item")
-
-        if not item:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Verification job with ID {verification_job_id} not found",
+        # 1. Delete the item from DynamoDB, returning it so its Items can be released
+        try:
+            delete_response = await asyncio.to_thread(
+                verification_jobs_table.delete_item,
+                Key={"id": verification_job_id},
+                ConditionExpression=Attr("id").exists(),
+                ReturnValues="ALL_OLD",
             )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Verification job with ID {verification_job_id} not found",
+                ) from e
+            raise
+        item = delete_response.get("Attributes", {})
 
-        # 3. Delete the item from DynamoDB
-        verification_jobs_table.delete_item(Key={"id": verification_job_id})
+        # 2. Release the job's Items so they can be deleted again
+        await asyncio.to_thread(
+            unlink_job_items,
+            verification_job_id,
+            [
+                instance["item_id"]
+                for instance in item.get("items", [])
+                if isinstance(instance, dict) and instance.get("item_id")
+            ],
+        )
         # No return needed for 204
 
     except HTTPException as e:  # Re-raise our 404
@@ -30,7 +47,7 @@ async def delete_verification_job(verification_job_id: str) -> None:
         print(
             f"DynamoDB ClientError during delete operation for job {verification_job_id}: {e}"
         )
-        # If delete_item fails after get_item succeeded, it's likely a 500-level issue.
+        # Anything other than a missing job is a 500-level issue.
         # Safely access error details from boto3 ClientError response
         error_message = "Unknown error"
         if hasattr(e, 'response') and e.response:
@@ -1,7 +1,16 @@
+import logging
+import asyncio
 from fastapi import HTTPException, status
 from botocore.exceptions import ClientError
 from schemas.datamodel import Agent
-from .agent_utils import agent_table, dynamodb_item_to_agent
+from .agent_utils import (
+    agent_table,
+    cache_agent,
+    get_cached_agent,
+    dynamodb_item_to_agent,
+)
+
+logger = logging.getLogger(__name__)
 
 
 async def get_agent(agent_id: str) -> Agent:
@@ -14,8 +23,12 @@ async def get_agent(agent_id: str) -> Agent:
     Returns:
         Agent: The Agent object corresponding to the given ID.
     """
+    cached = get_cached_agent(agent_id)
+    if cached is not None:
+        return cached
+
     try:
-        response = agent_table.get_item(Key={"id": agent_id})
+        response = await asyncio.to_thread(agent_table.get_item, Key={"id": agent_id})
         
         if "Item" not in response:
             raise HTTPException(
@@ -24,18 +37,19 @@ async def get_agent(agent_id: str) -> Agent:
             )
         
         agent = dynamodb_item_to_agent(response["Item"])
+        cache_agent(agent)
         return agent
         
     except HTTPException:
         raise
     except ClientError as e:
-        print(f"Error retrieving Agent {agent_id}: {e}")
+        logger.exception("Error retrieving Agent %s", agent_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve Agent: {e.response['Error']['Message']}",
         ) from e
     except Exception as e:
-        print(f"Unexpected error retrieving Agent {agent_id}: {e}")
+        logger.exception("Unexpected error retrieving Agent %s", agent_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}",
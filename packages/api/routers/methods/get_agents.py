@@ -1,8 +1,18 @@
-from typing import List
+import logging
+import asyncio
+from typing import Any, Dict, List
 from fastapi import HTTPException, status
 from botocore.exceptions import ClientError
 from schemas.datamodel import Agent
-from .agent_utils import agent_table, dynamodb_item_to_agent
+from .agent_utils import (
+    agent_table,
+    cache_agent_list,
+    get_cached_agent_list,
+    dynamodb_item_to_agent,
+)
+
+logger = logging.getLogger(__name__)
+
 
 async def get_agents() -> List[Agent]:
     """
@@ -11,24 +21,33 @@ async def get_agents() -> List[Agent]:
     Returns:
         List[Agent]: A list of all Agent objects.
     """
+    cached = get_cached_agent_list()
+    if cached is not None:
+        return cached
+
     try:
-        response = agent_table.scan()
+        # Follow LastEvaluatedKey so agents beyond the first 1 MB page are included
+        scan_kwargs: Dict[str, Any] = {}
         agents = []
-        
-        for item in response.get("Items", []):
-            agent = dynamodb_item_to_agent(item)
-            agents.append(agent)
-            
+        while True:
+            response = await asyncio.to_thread(agent_table.scan, **scan_kwargs)
+            for item in response.get("Items", []):
+                agents.append(dynamodb_item_to_agent(item))
+            if "LastEvaluatedKey" not in response:
+                break
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+        cache_agent_list(agents)
         return agents
         
     except ClientError as e:
-        print(f"Error retrieving Agents: {e}")
+        logger.exception("Error retrieving Agents")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve Agents: {e.response['Error']['Message']}",
         ) from e
     except Exception as e:
-        print(f"Unexpected error retrieving Agents: {e}")
+        logger.exception("Unexpected error retrieving Agents")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}",
@@ -1,8 +1,13 @@
+import logging
 from typing import List, Set
 from fastapi import HTTPException, status
 from schemas.datamodel import Agent
 from .verification_job_utils import fetch_verification_job
-from .get_agent import get_agent as get_agent_impl
+from .agent_utils import cache_agent, dynamodb_item_to_agent, get_cached_agent
+from .collection_utils import batch_get_items
+from constants import AGENTS_TABLE_NAME
+
+logger = logging.getLogger(__name__)
 
 
 async def get_agents_used_in_job(verification_job_id: str) -> List[Agent]:
@@ -17,7 +22,7 @@ async def get_agents_used_in_job(verification_job_id: str) -> List[Agent]:
     """
     try:
         # Fetch the verification job
-        verification_job, _ = fetch_verification_job(verification_job_id)
+        verification_job, _ = await fetch_verification_job(verification_job_id)
         
         # Collect unique agent IDs from all item instances
         agent_ids: Set[str] = set()
@@ -26,17 +31,34 @@ async def get_agents_used_in_job(verification_job_id: str) -> List[Agent]:
             if item_instance.agent_ids:
                 agent_ids.update(item_instance.agent_ids)
         
-        # Fetch all agents by their IDs
+        # Serve cached agents, then fetch the rest with BatchGetItem
         agents: List[Agent] = []
+        missing_ids: List[str] = []
         for agent_id in agent_ids:
-            try:
-                agent = await get_agent_impl(agent_id)
+            cached = get_cached_agent(agent_id)
+            if cached is not None:
+                agents.append(cached)
+            else:
+                missing_ids.append(agent_id)
+
+        if missing_ids:
+            items = await batch_get_items(
+                AGENTS_TABLE_NAME, [{"id": agent_id} for agent_id in missing_ids]
+            )
+            found_ids: Set[str] = set()
+            for item in items:
+                found_ids.add(item["id"])
+                try:
+                    agent = dynamodb_item_to_agent(item)
+                except Exception as e:
+                    # Log the error but continue with other agents
+                    logger.warning("Could not parse agent %s: %s", item.get("id"), e)
+                    continue
                 agents.append(agent)
-            except HTTPException as e:
-                # Log the error but continue with other agents
-                print(f"Warning: Could not retrieve agent {agent_id}: {e.detail}")
-                continue
-        
+                cache_agent(agent)
+            for agent_id in set(missing_ids) - found_ids:
+                logger.warning("Could not retrieve agent %s: not found", agent_id)
+
         return agents
         
     except ValueError as e:
@@ -46,7 +68,9 @@ async def get_agents_used_in_job(verification_job_id: str) -> List[Agent]:
             detail=str(e),
         ) from e
     except Exception as e:
-        print(f"Unexpected error retrieving agents for job {verification_job_id}: {e}")
+        logger.exception(
+            "Unexpected error retrieving agents for job %s", verification_job_id
+        )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}",
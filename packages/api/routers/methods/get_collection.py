@@ -1,25 +1,35 @@
+import logging
+import asyncio
 from fastapi import HTTPException, status
 from botocore.exceptions import ClientError
 
 # Import necessary models and utils
-from .collection_utils import collections_table, dynamodb_item_to_collection
+from .collection_utils import (
+    collections_table,
+    dynamodb_item_to_collection,
+)
 from schemas.requests_responses import CollectionResponse
 
+logger = logging.getLogger(__name__)
+
 
 async def get_collection(collection_id: str) -> CollectionResponse:
     """
     Implementation to retrieve a specific collection by its ID.
     """
     try:
-        response = collections_table.get_item(Key={"id": collection_id})
+        response = await asyncio.to_thread(
+            collections_table.get_item, Key={"id": collection_id}
+        )
         item = response.get("Item")
         if not item:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found"
             )
-        return CollectionResponse(collection=dynamodb_item_to_collection(item))
+        collection = dynamodb_item_to_collection(item)
+        return CollectionResponse(collection=collection)
     except ClientError as e:
-        print(f"Error retrieving collection {collection_id}: {e}")
+        logger.exception("Error retrieving collection %s", collection_id)
         error_message = "Unknown error"
         if hasattr(e, 'response') and e.response:
             error_dict = e.response.get('Error', {})
@@ -31,7 +41,7 @@ async def get_collection(collection_id: str) -> CollectionResponse:
     except HTTPException as e:  # Re-raise our 404
         raise e
     except Exception as e:
-        print(f"Unexpected error retrieving collection {collection_id}: {e}")
+        logger.exception("Unexpected error retrieving collection %s", collection_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}",
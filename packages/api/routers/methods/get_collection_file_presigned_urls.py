@@ -1,12 +1,25 @@
+import logging
+import asyncio
 from fastapi import HTTPException, status
-from typing import Dict
+from typing import Dict, List, Tuple
 from botocore.exceptions import ClientError
 
 # Import necessary models and utils
-from .collection_utils import collections_table, s3_client
+from .collection_utils import collections_table
 from constants import STORAGE_BUCKET_NAME  # Import constant directly
+from utils.s3_helpers import presign_s3_url
 from schemas.requests_responses import CollectionFilePresignedUrlsResponse
 
+logger = logging.getLogger(__name__)
+
+
+def _presign_downloads(files: List[Tuple[str, str]]) -> Dict[str, str]:
+    """Signs a GET URL for each (file_id, s3_key); runs off the event loop as signing is CPU-bound."""
+    return {
+        file_id: presign_s3_url("GET", STORAGE_BUCKET_NAME, s3_key, 3600)  # 1 hour
+        for file_id, s3_key in files
+    }
+
 
 async def get_collection_file_presigned_urls(
     collection_id: str,
@@ -15,8 +28,10 @@ async def get_collection_file_presigned_urls(
     Implementation to retrieve presigned GET URLs for all files associated with a specific collection.
     """
     try:
-        response = collections_table.get_item(
-            Key={"id": collection_id}, ProjectionExpression="id, files"
+        response = await asyncio.to_thread(
+            collections_table.get_item,
+            Key={"id": collection_id},
+            ProjectionExpression="id, files",
         )
         item = response.get("Item")
         if not item:
@@ -26,20 +41,24 @@ async def get_collection_file_presigned_urls(
 
         collection_files = item.get("files", [])
         if not isinstance(collection_files, list):
-            print(
-                f"Warning: 'files' attribute for collection {collection_id} is not a list: {collection_files}"
+            logger.warning(
+                "'files' attribute for collection %s is not a list: %s",
+                collection_id,
+                collection_files,
             )
             collection_files = []
 
-        presigned_urls: Dict[str, str] = {}
+        files_to_sign: List[Tuple[str, str]] = []
         for file_info_dict in collection_files:
             if (
                 not isinstance(file_info_dict, dict)
                 or "id" not in file_info_dict
                 or "s3_key" not in file_info_dict
             ):
-                print(
-                    f"Warning: Skipping invalid file data in collection {collection_id}: {file_info_dict}"
+                logger.warning(
+                    "Skipping invalid file data in collection %s: %s",
+                    collection_id,
+                    file_info_dict,
                 )
                 continue
 
@@ -47,29 +66,22 @@ async def get_collection_file_presigned_urls(
             s3_key = file_info_dict.get("s3_key")
 
             if not s3_key:
-                print(
-                    f"Warning: Skipping file ID {file_id} in collection {collection_id} due to missing or empty s3_key."
+                logger.warning(
+                    "Skipping file ID %s in collection %s due to missing or empty s3_key.",
+                    file_id,
+                    collection_id,
                 )
                 continue
 
-            try:
-                url = s3_client.generate_presigned_url(
-                    "get_object",
-                    Params={"Bucket": STORAGE_BUCKET_NAME, "Key": s3_key},
-                    ExpiresIn=3600,  # 1 hour
-                )
-                presigned_urls[file_id] = url
-            except ClientError as e:
-                print(
-                    f"Error generating presigned URL for file {file_id} (key: {s3_key}): {e}"
-                )
-                continue  # Skip this file
+            files_to_sign.append((file_id, s3_key))
+
+        presigned_urls = await asyncio.to_thread(_presign_downloads, files_to_sign)
 
         return CollectionFilePresignedUrlsResponse(presigned_urls=presigned_urls)
 
     except ClientError as e:
-        print(
-            f"DynamoDB error retrieving collection {collection_id} for presigned URLs: {e}"
+        logger.exception(
+            "DynamoDB error retrieving collection %s for presigned URLs", collection_id
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -78,8 +90,8 @@ async def get_collection_file_presigned_urls(
     except HTTPException as e:  # Re-raise our 404
         raise e
     except Exception as e:
-        print(
-            f"Unexpected error generating presigned URLs for collection {collection_id}: {e}"
+        logger.exception(
+            "Unexpected error generating presigned URLs for collection %s", collection_id
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
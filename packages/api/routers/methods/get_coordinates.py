@@ -1,3 +1,9 @@
+import asyncio
+import logging
+import threading
+from typing import Optional, Tuple
+
+from cachetools import TTLCache
 from fastapi import HTTPException, status
 from botocore.exceptions import ClientError
 
@@ -7,6 +13,30 @@ from utils.map import get_coordinates_from_address
 # Define request/response models locally or import if defined elsewhere
 from pydantic import BaseModel
 
+logger = logging.getLogger(__name__)
+
+# Geocoding is idempotent and billed per call, so results are kept for a day
+_GEOCODE_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=86_400)
+# TTLCache is not thread-safe and lookups run in worker threads
+_geocode_cache_lock = threading.Lock()
+
+
+def _geocode(address: str) -> Optional[Tuple[float, float]]:
+    """
+    Geocodes the address as given, reusing results for addresses that differ only
+    in case or surrounding whitespace. Misses aren't cached, so an address that
+    isn't found yet can still resolve later.
+    """
+    cache_key = address.strip().lower()
+    with _geocode_cache_lock:
+        coordinates = _GEOCODE_CACHE.get(cache_key)
+    if coordinates is None:
+        coordinates = get_coordinates_from_address(address)
+        if coordinates is not None:
+            with _geocode_cache_lock:
+                _GEOCODE_CACHE[cache_key] = coordinates
+    return coordinates
+
 
 class CoordinatesRequest(BaseModel):
     address: str
@@ -22,7 +52,7 @@ async def get_coordinates(request: CoordinatesRequest) -> CoordinatesResponse:
     Implementation to get the latitude and longitude coordinates for a given address.
     """
     try:
-        coordinates = get_coordinates_from_address(request.address)
+        coordinates = await asyncio.to_thread(_geocode, request.address)
         if coordinates is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -31,7 +61,7 @@ async def get_coordinates(request: CoordinatesRequest) -> CoordinatesResponse:
         latitude, longitude = coordinates
         return CoordinatesResponse(latitude=latitude, longitude=longitude)
     except ClientError as e:
-        print(f"Error calling AWS Location Service for coordinates: {e}")
+        logger.exception("Error calling AWS Location Service for coordinates")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get coordinates: {e.response['Error']['Message']}",
@@ -39,7 +69,7 @@ async def get_coordinates(request: CoordinatesRequest) -> CoordinatesResponse:
     except HTTPException as e:  # Re-raise our 404
         raise e
     except Exception as e:
-        print(f"Unexpected error getting coordinates: {e}")
+        logger.exception("Unexpected error getting coordinates")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}",
@@ -1,17 +1,20 @@
+import logging
+import asyncio
 from fastapi import HTTPException, status
 from schemas.datamodel import Item
 from botocore.exceptions import ClientError
-from .item_utils import item_table
+from .item_utils import get_item_record
 from .collection_utils import dynamodb_item_to_item
 
+logger = logging.getLogger(__name__)
+
 
 async def get_item(item_id: str) -> Item:
     """
     Retrieve a specific Item record by ID.
     """
     try:
-        response = item_table.get_item(Key={"id": item_id})
-        item = response.get("Item")
+        item = await asyncio.to_thread(get_item_record, item_id)
         if not item:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -19,7 +22,7 @@ async def get_item(item_id: str) -> Item:
             )
         return dynamodb_item_to_item(item)
     except ClientError as e:
-        print(f"Error retrieving Item {item_id}: {e}")  # Add logging
+        logger.exception("Error retrieving Item %s", item_id)
         # Boto3 raises ClientError for various issues, check if it's specifically 'ResourceNotFoundException'
         # Although get_item doesn't raise ResourceNotFoundException, it returns no 'Item'.
         # This generic handling is okay here, but could be more specific if needed.
@@ -30,7 +33,7 @@ async def get_item(item_id: str) -> Item:
     except HTTPException as e:  # Re-raise our specific 404
         raise e
     except Exception as e:
-        print(f"Unexpected error retrieving Item {item_id}: {e}")  # Add logging
+        logger.exception("Unexpected error retrieving Item %s", item_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}",
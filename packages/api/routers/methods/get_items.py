@@ -1,34 +1,77 @@
+import logging
+from typing import AsyncIterator, Optional
 from fastapi import HTTPException, status
 from schemas.requests_responses import ItemListResponse
 from botocore.exceptions import ClientError
 from .item_utils import item_table  # Updated import
-from .collection_utils import dynamodb_item_to_item  # Updated import
+from .collection_utils import (
+    dynamodb_items_to_items,
+    parallel_scan,
+    parse_last_evaluated_key,
+    scan_page,
+    scan_pages,
+    start_ndjson_stream,
+)
 
+logger = logging.getLogger(__name__)
 
-async def get_items() -> ItemListResponse:
+
+async def get_items(
+    limit: Optional[int] = None, last_evaluated_key: Optional[str] = None
+) -> ItemListResponse:
     """
     Retrieve a list of all Item records.
+
+    With a limit, only one page of at most `limit` Items is read, starting after
+    `last_evaluated_key`, and the cursor for the next page is returned.
     """
     try:
-        response = item_table.scan()
-        items = [dynamodb_item_to_item(item) for item in response.get("Items", [])]
-        # Handle pagination if necessary
-        while "LastEvaluatedKey" in response:
-            response = item_table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            items.extend(
-                [dynamodb_item_to_item(item) for item in response.get("Items", [])]
+        if limit is None:
+            items = dynamodb_items_to_items(await parallel_scan(item_table))
+            return ItemListResponse(items=items)
+
+        try:
+            start_key = (
+                parse_last_evaluated_key(last_evaluated_key) if last_evaluated_key else None
             )
-        return ItemListResponse(items=items)
+        except ValueError as e:  # Includes JSONDecodeError
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid format for last_evaluated_key: {e}",
+            ) from e
+        page, next_key = await scan_page(item_table, limit, start_key)
+        return ItemListResponse(
+            items=dynamodb_items_to_items(page),
+            last_evaluated_key=next_key,
+        )
+    except HTTPException:
+        raise
     except ClientError as e:
-        print(f"Error scanning Item table: {e}")  # Add logging
+        logger.exception("Error scanning Item table")
         error_message = e.response.get('Error', {}).get('Message', str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve Items: {error_message}",
         ) from e
     except Exception as e:
-        print(f"Unexpected error retrieving Items: {e}")  # Add logging
+        logger.exception("Unexpected error retrieving Items")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}",
         ) from e
+
+
+async def _item_chunks() -> AsyncIterator[bytes]:
+    async for page in scan_pages(item_table):
+        yield "".join(
+            item.model_dump_json() + "\n" for item in dynamodb_items_to_items(page)
+        ).encode()
+
+
+async def stream_items() -> AsyncIterator[bytes]:
+    """
+    Stream every Item record as newline-delimited JSON, one scan page at a time.
+
+    The first page is read before returning, so early failures raise HTTPException.
+    """
+    return await start_ndjson_stream(_item_chunks(), "Items")
@@ -1,3 +1,4 @@
+import logging
 from fastapi import HTTPException, status
 
 # Import necessary models and utils from the verification_job_utils
@@ -5,6 +6,8 @@ from .verification_job_utils import fetch_verification_job
 from schemas.datamodel import VerificationJobDto
 from schemas.requests_responses import VerificationJobResponse
 
+logger = logging.getLogger(__name__)
+
 
 async def get_verification_job(verification_job_id: str) -> VerificationJobResponse:
     """
@@ -12,13 +15,13 @@ async def get_verification_job(verification_job_id: str) -> VerificationJobRespo
     """
     try:
         # Use the utility function to fetch the verification job with all associated data
-        verification_job, collection_name = fetch_verification_job(
+        verification_job, collection_name = await fetch_verification_job(
             verification_job_id
         )
 
         # Create the DTO with all the retrieved data
-        dto = VerificationJobDto(
-            **verification_job.model_dump(),
+        dto = VerificationJobDto.model_construct(
+            **verification_job.__dict__,
             collection_name=collection_name,
             total_cost=verification_job.cost,
         )
@@ -33,8 +36,8 @@ async def get_verification_job(verification_job_id: str) -> VerificationJobRespo
             detail=f"Verification job with ID {verification_job_id} not found",
         ) from e
     except Exception as e:
-        print(
-            f"Unexpected error retrieving verification job {verification_job_id}: {e}"
+        logger.exception(
+            "Unexpected error retrieving verification job %s", verification_job_id
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,13 +1,17 @@
+import asyncio
+import logging
 from fastapi import HTTPException, status
 
 # Import necessary models and utils from the verification_job_utils
-from .verification_job_utils import s3_client, verification_jobs_table
+from .verification_job_utils import verification_jobs_table
 
 # Import the utility function directly from its location
 from utils.s3_helpers import generate_presigned_urls_for_job_files
 from constants import STORAGE_BUCKET_NAME  # Import constant directly
 from schemas.requests_responses import VerificationJobFilePresignedUrlsResponse
 
+logger = logging.getLogger(__name__)
+
 
 async def get_verification_job_files_url(
     verification_job_id: str,
@@ -16,23 +20,17 @@ async def get_verification_job_files_url(
     Implementation to generate and return presigned GET URLs for all files associated with a verification job.
     """
     try:
-        # Call the synchronous utility function
-        presigned_urls = generate_presigned_urls_for_job_files(
+        # The utility reads the job and signs URLs synchronously, so it runs in a worker thread
+        presigned_urls = await asyncio.to_thread(
+            generate_presigned_urls_for_job_files,
             verification_job_id=verification_job_id,
-            s3_client=s3_client,
             verification_jobs_table=verification_jobs_table,
             storage_bucket_name=STORAGE_BUCKET_NAME,
             expires_in=43200,  # 12 hours expiry
         )
 
-        # The utility function handles the case where the job is not found by returning {}
-        # If the job wasn't found (utility logged a warning and returned {}),
-        # we might want to return 404 here explicitly.
-        # Let's check if the job exists first for a clearer 404.
-        job_exists_check = verification_jobs_table.get_item(
-            Key={"id": verification_job_id}
-        )
-        if "Item" not in job_exists_check:
+        # The utility function returns None when the job does not exist
+        if presigned_urls is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Verification job with ID {verification_job_id} not found",
@@ -45,8 +43,9 @@ async def get_verification_job_files_url(
         raise e
     except Exception as e:
         # Catch any unexpected errors from the utility function or this handler
-        print(
-            f"Unexpected error in get_verification_job_files_url handler for job {verification_job_id}: {e}"
+        logger.exception(
+            "Unexpected error in get_verification_job_files_url handler for job %s",
+            verification_job_id,
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,4 +1,5 @@
-import json
+import logging
+import asyncio
 from fastapi import HTTPException, status
 from typing import Optional, Any
 from decimal import Decimal
@@ -8,23 +9,35 @@ from boto3.dynamodb.conditions import Key, Attr
 # Import necessary models and utils from the verification_job_utils
 from .verification_job_utils import (
     verification_job_logs_table,
-    dynamodb_item_to_verification_job_log_entry,
+    dynamodb_items_to_verification_job_log_entries,
 )
 from schemas.requests_responses import VerificationJobLogListResponse
 
+try:
+    import orjson as _json
+except ImportError:  # Fall back to the stdlib parser if orjson is unavailable
+    import json as _json  # type: ignore[no-redef]
+
+logger = logging.getLogger(__name__)
 
-# Helper to convert Decimals in a structure to int/float for JSON serialization
-def _convert_decimals_for_json(data: Any) -> Any:
-    if isinstance(data, list):
-        return [_convert_decimals_for_json(v) for v in data]
-    elif isinstance(data, dict):
-        return {k: _convert_decimals_for_json(v) for k, v in data.items()}
-    elif isinstance(data, Decimal):
-        if data % 1 == 0:
-            return int(data)
-        else:
-            return float(data)
-    return data
+
+# Only the attributes of VerificationJobLogEntry are read back; timestamp and level are
+# reserved words in DynamoDB expressions, so they go through placeholders
+_LOG_ENTRY_PROJECTION = "id, #ts, verification_job_id, #lvl, message"
+_LOG_ENTRY_PROJECTION_NAMES = {"#ts": "timestamp", "#lvl": "level"}
+
+
+# Helper to convert the Decimals in a DynamoDB key to int/float for JSON serialization.
+# Keys are flat dicts of scalar attributes, so there is nothing to recurse into.
+def _convert_decimals_for_json(key: dict[str, Any]) -> dict[str, Any]:
+    return {
+        k: (
+            (int(v) if v.as_tuple().exponent >= 0 else float(v))
+            if isinstance(v, Decimal)
+            else v
+        )
+        for k, v in key.items()
+    }
 
 
 async def get_verification_job_logs(
@@ -36,36 +49,37 @@ async def get_verification_job_logs(
 ) -> VerificationJobLogListResponse:
     """
     Implementation to retrieve log entries for a specific verification job, with pagination and optional message content search.
-    Uses the `verification-job-id-index` GSI.
+    Uses the `verification-job-id-index` GSI, or the `job-level-ts-index` GSI when
+    filtering by log level so that only entries at that level are read.
     """
     try:
+        key_condition = Key("verification_job_id").eq(verification_job_id)
+        if log_level:
+            # level_ts is "<LEVEL>#<timestamp>", so the prefix selects one level in time order
+            index_name = "job-level-ts-index"
+            key_condition = key_condition & Key("level_ts").begins_with(
+                f"{log_level.upper()}#"
+            )
+        else:
+            index_name = "verification-job-id-index"
+
         query_kwargs = {
-            "IndexName": "verification-job-id-index",
-            "KeyConditionExpression": Key("verification_job_id").eq(
-                verification_job_id
-            ),
+            "IndexName": index_name,
+            "KeyConditionExpression": key_condition,
             "Limit": limit,
             "ScanIndexForward": False,  # Get newest logs first
+            "ProjectionExpression": _LOG_ENTRY_PROJECTION,
+            # Copied, as boto3 adds the filter's placeholders to this dict
+            "ExpressionAttributeNames": dict(_LOG_ENTRY_PROJECTION_NAMES),
         }
 
-        # Build filter expression dynamically
-        filter_expression: Optional[Attr] = None
+        # Message search can't be expressed as a key condition, so it stays a filter
         if search_string:
-            filter_expression = Attr("message").contains(search_string)
-
-        if log_level:
-            level_filter = Attr("level").eq(log_level.upper())
-            if filter_expression:
-                filter_expression = filter_expression & level_filter
-            else:
-                filter_expression = level_filter
-
-        if filter_expression:
-            query_kwargs["FilterExpression"] = filter_expression
+            query_kwargs["FilterExpression"] = Attr("message").contains(search_string)
 
         if last_evaluated_key:
             try:
-                exclusive_start_key = json.loads(last_evaluated_key)
+                exclusive_start_key = _json.loads(last_evaluated_key)
                 if not isinstance(exclusive_start_key, dict):
                     raise ValueError("last_evaluated_key must be a JSON object")
                 if "timestamp" in exclusive_start_key:
@@ -79,18 +93,17 @@ async def get_verification_job_logs(
                             "Timestamp in last_evaluated_key must be a number"
                         ) from e
                 query_kwargs["ExclusiveStartKey"] = exclusive_start_key
-            except (json.JSONDecodeError, ValueError) as e:
+            except ValueError as e:  # Includes JSONDecodeError from either parser
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Invalid format for last_evaluated_key: {e}",
                 ) from e
 
-        response = verification_job_logs_table.query(**query_kwargs)
+        response = await asyncio.to_thread(
+            verification_job_logs_table.query, **query_kwargs
+        )
 
-        items = [
-            dynamodb_item_to_verification_job_log_entry(item)
-            for item in response.get("Items", [])
-        ]
+        items = dynamodb_items_to_verification_job_log_entries(response.get("Items", []))
         next_key = response.get("LastEvaluatedKey")
 
         # Convert Decimals in next_key for Pydantic validation
@@ -103,7 +116,9 @@ async def get_verification_job_logs(
         )
 
     except ClientError as e:
-        print(f"Error retrieving logs for verification job {verification_job_id}: {e}")
+        logger.exception(
+            "Error retrieving logs for verification job %s", verification_job_id
+        )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve verification job logs: {e.response['Error']['Message']}",
@@ -111,8 +126,9 @@ async def get_verification_job_logs(
     except HTTPException as e:  # Re-raise our 400
         raise e
     except Exception as e:
-        print(
-            f"Unexpected error retrieving logs for verification job {verification_job_id}: {e}"
+        logger.exception(
+            "Unexpected error retrieving logs for verification job %s",
+            verification_job_id,
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
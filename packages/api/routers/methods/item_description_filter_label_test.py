@@ -1,3 +1,4 @@
+import asyncio
 import os
 import logging
 from typing import List
@@ -22,6 +23,9 @@ if not STORAGE_BUCKET_NAME:
     # Raise an error as the bucket name is essential
     raise ValueError("S3 bucket name not configured in environment variables")
 
+# Images fetched and labelled at once when testing a rule
+LABEL_TEST_CONCURRENCY = 16
+
 
 async def item_label_filter_rule_test(
     request: TestLabelFilteringRuleRequest,
@@ -31,23 +35,26 @@ async def item_label_filter_rule_test(
 
     Fetches images from S3, runs Rekognition label detection, and returns the results.
     """
-    labels: List[TestLabelFilteringRuleLabel] = []
     image_keys = request.image_s3_keys or []  # Ensure it's a list
+    semaphore = asyncio.Semaphore(LABEL_TEST_CONCURRENCY)
 
     logger.info(f"Starting label detection test for {len(image_keys)} image keys.")
 
-    for s3_key in image_keys:
-        try:
-            logger.debug(f"Fetching image bytes for key: {s3_key}")
-            image_bytes = await get_image_bytes_from_s3(STORAGE_BUCKET_NAME, s3_key)
+    async def _labels_for_key(s3_key: str) -> List[TestLabelFilteringRuleLabel]:
+        key_labels: List[TestLabelFilteringRuleLabel] = []
+        async with semaphore:
+            try:
+                logger.debug(f"Fetching image bytes for key: {s3_key}")
+                image_bytes = await get_image_bytes_from_s3(STORAGE_BUCKET_NAME, s3_key)
 
-            if image_bytes:
-                logger.debug(f"Detecting labels for key: {s3_key}")
-                detected_labels = await detect_labels_s3(image_bytes=image_bytes,resize_image=True)
-                for label in detected_labels:
-                    if label.get("Confidence", 0) > 70:
-                        # Only consider labels with confidence greater than 70
-                        labels.append(
+                if image_bytes:
+                    logger.debug(f"Detecting labels for key: {s3_key}")
+                    # Only consider labels with confidence of at least 70, filtered by Rekognition
+                    detected_labels = await detect_labels_s3(
+                        image_bytes=image_bytes, resize_image=True, min_confidence=70
+                    )
+                    for label in detected_labels:
+                        key_labels.append(
                             TestLabelFilteringRuleLabel(
                                 name=label["Name"],
                                 confidence=label["Confidence"]
@@ -55,12 +62,17 @@ async def item_label_filter_rule_test(
                                 s3_key=s3_key,
                             )
                         )
-                logger.debug(f"Detected {len(labels)} labels for key: {s3_key}")
-            else:
-                logger.warning(f"Could not retrieve image bytes for key: {s3_key}")
+                    logger.debug(f"Detected {len(key_labels)} labels for key: {s3_key}")
+                else:
+                    logger.warning(f"Could not retrieve image bytes for key: {s3_key}")
+
+            except Exception as e:
+                logger.error(f"Error processing key {s3_key}: {e}", exc_info=True)
+        return key_labels
 
-        except Exception as e:
-            logger.error(f"Error processing key {s3_key}: {e}", exc_info=True)
+    # Keys are processed concurrently; gather keeps the labels in request order
+    results = await asyncio.gather(*(_labels_for_key(s3_key) for s3_key in image_keys))
+    labels = [label for key_labels in results for label in key_labels]
 
     logger.info("Label detection test completed.")
     logger.info(f"Detected {len(labels)} labels across {len(image_keys)} images.")
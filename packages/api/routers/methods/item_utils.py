@@ -1,12 +1,77 @@
-import boto3
-from routers.methods.collection_utils import dynamodb_item_to_item
+import logging
+from typing import Any, Dict, List, Optional
+from aws_clients import dynamodb, dynamodb_client
+from routers.methods.collection_utils import (
+    batch_get_items,
+    dynamodb_item_to_item,
+    from_attribute_values,
+)
 from schemas.datamodel import Item
-from constants import AWS_REGION, ITEMS_TABLE_NAME, VERIFICATION_JOBS_TABLE_NAME
+from constants import ITEMS_TABLE_NAME
+
+logger = logging.getLogger(__name__)
 
 # Initialize DynamoDB
-dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
 item_table = dynamodb.Table(ITEMS_TABLE_NAME)
-verification_job_table = dynamodb.Table(VERIFICATION_JOBS_TABLE_NAME)
+
+# Reads only the attributes of the Item model; every name goes through a placeholder
+# since several of them (name, description) are DynamoDB reserved words
+ITEM_PROJECTION_NAMES = {f"#f{i}": field for i, field in enumerate(Item.model_fields)}
+ITEM_PROJECTION = ", ".join(ITEM_PROJECTION_NAMES)
+
+
+def get_item_record(item_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the Item model's attributes for one Item through the low-level client,
+    which skips the resource layer's per-call wrapping of the response.
+
+    Args:
+        item_id (str): The ID of the Item to read
+
+    Returns:
+        Optional[Dict[str, Any]]: The plain DynamoDB item, or None if not found
+    """
+    response = dynamodb_client.get_item(
+        TableName=ITEMS_TABLE_NAME,
+        Key={"id": {"S": item_id}},
+        ProjectionExpression=ITEM_PROJECTION,
+        ExpressionAttributeNames=ITEM_PROJECTION_NAMES,
+    )
+    item = response.get("Item")
+    return from_attribute_values(item) if item else None
+
+
+def warm_dynamodb_connection() -> None:
+    """
+    Opens the shared DynamoDB connections (and resolves credentials) ahead of the
+    first request. Every table handle shares the resource's client, so one
+    DescribeTable primes it for all tables; the low-level client has its own pool.
+    """
+    try:
+        item_table.load()
+        dynamodb_client.describe_table(TableName=ITEMS_TABLE_NAME)
+    except Exception:
+        # Warming is best effort; a failure here surfaces on the first real call instead
+        logger.warning("Failed to warm DynamoDB connection", exc_info=True)
+
+
+async def get_items_by_ids(item_ids: List[str]) -> List[Item]:
+    """
+    Retrieve Items by ID using BatchGetItem rather than one get_item per ID.
+
+    Args:
+        item_ids (List[str]): The IDs to fetch; duplicates are fetched once
+
+    Returns:
+        List[Item]: The Items in the order requested (repeating any duplicated IDs),
+        skipping IDs that do not exist
+    """
+    unique_ids = list(dict.fromkeys(item_ids))
+    records = await batch_get_items(
+        ITEMS_TABLE_NAME, [{"id": item_id} for item_id in unique_ids]
+    )
+    items_by_id = {record["id"]: dynamodb_item_to_item(record) for record in records}
+    return [items_by_id[item_id] for item_id in item_ids if item_id in items_by_id]
 
 
 def get_items_by_name(item_name: str) -> list[Item] | None:
@@ -19,12 +84,21 @@ def get_items_by_name(item_name: str) -> list[Item] | None:
     Returns:
         list[Item] | None: The retrieved Item objects or None if not found
     """
-    from boto3.dynamodb.conditions import Attr
-
-    # Use scan with filter expression to find items by name
-    response = item_table.scan(FilterExpression=Attr("name").eq(item_name))
-
-    items = response.get("Items", [])
+    # Query the name GSI, following pagination to collect every match
+    query_kwargs: Dict[str, Any] = {
+        "TableName": ITEMS_TABLE_NAME,
+        "IndexName": "name-index",
+        "KeyConditionExpression": "#name = :name",
+        "ExpressionAttributeNames": {"#name": "name"},
+        "ExpressionAttributeValues": {":name": {"S": item_name}},
+    }
+    items: List[Dict[str, Any]] = []
+    while True:
+        response = dynamodb_client.query(**query_kwargs)
+        items.extend(from_attribute_values(raw) for raw in response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            break
+        query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
 
     # Convert all matching items to Item objects
     item_objects = []
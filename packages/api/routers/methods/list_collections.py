@@ -1,51 +1,100 @@
+import logging
 from fastapi import HTTPException, status
-from typing import Optional
+from typing import AsyncIterator, Optional
 from botocore.exceptions import ClientError
 from boto3.dynamodb.conditions import Attr
 
 # Import necessary models and utils
-from .collection_utils import collections_table, dynamodb_item_to_collection
+from .collection_utils import (
+    collections_table,
+    dynamodb_item_to_collection,
+    parallel_scan,
+    parse_last_evaluated_key,
+    scan_page,
+    scan_pages,
+    start_ndjson_stream,
+)
 from schemas.datamodel import AssessmentStatus
 from schemas.requests_responses import CollectionsListResponse
 
+logger = logging.getLogger(__name__)
+
 
 async def list_collections(
     filter_status: Optional[AssessmentStatus] = None,
+    limit: Optional[int] = None,
+    last_evaluated_key: Optional[str] = None,
 ) -> CollectionsListResponse:
     """
     Implementation to retrieve a list of all collections, with optional filtering by status.
+
+    With a limit, only one page of at most `limit` collections is read, starting after
+    `last_evaluated_key`, and the cursor for the next page is returned.
     """
     try:
         scan_kwargs = {}
         if filter_status:
             scan_kwargs["FilterExpression"] = Attr("status").eq(filter_status.value)
 
-        response = collections_table.scan(**scan_kwargs)
+        if limit is not None:
+            try:
+                start_key = (
+                    parse_last_evaluated_key(last_evaluated_key)
+                    if last_evaluated_key
+                    else None
+                )
+            except ValueError as e:  # Includes JSONDecodeError
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid format for last_evaluated_key: {e}",
+                ) from e
+            page, next_key = await scan_page(
+                collections_table, limit, start_key, **scan_kwargs
+            )
+            return CollectionsListResponse(
+                items=[dynamodb_item_to_collection(item) for item in page],
+                last_evaluated_key=next_key,
+            )
+
         items = [
-            dynamodb_item_to_collection(item) for item in response.get("Items", [])
+            dynamodb_item_to_collection(item)
+            for item in await parallel_scan(collections_table, **scan_kwargs)
         ]
 
-        # Handle pagination
-        while "LastEvaluatedKey" in response:
-            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
-            response = collections_table.scan(**scan_kwargs)
-            items.extend(
-                [
-                    dynamodb_item_to_collection(item)
-                    for item in response.get("Items", [])
-                ]
-            )
-
         return CollectionsListResponse(items=items)
+    except HTTPException:
+        raise
     except ClientError as e:
-        print(f"Error listing collections: {e}")
+        logger.exception("Error listing collections")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve collections: {e.response['Error']['Message']}",
         ) from e
     except Exception as e:
-        print(f"Unexpected error listing collections: {e}")
+        logger.exception("Unexpected error listing collections")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}",
         ) from e
+
+
+async def stream_collections(
+    filter_status: Optional[AssessmentStatus] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Stream every collection, optionally filtered by status, as newline-delimited JSON.
+
+    The first page is read before returning, so early failures raise HTTPException.
+    """
+    scan_kwargs = {}
+    if filter_status:
+        scan_kwargs["FilterExpression"] = Attr("status").eq(filter_status.value)
+
+    async def chunks() -> AsyncIterator[bytes]:
+        async for page in scan_pages(collections_table, **scan_kwargs):
+            yield "".join(
+                dynamodb_item_to_collection(item).model_dump_json() + "\n"
+                for item in page
+            ).encode()
+
+    return await start_ndjson_stream(chunks(), "collections")
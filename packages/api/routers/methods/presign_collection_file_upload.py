@@ -1,12 +1,57 @@
+import logging
+import asyncio
 import uuid
 import time
+from typing import Dict
+from cachetools import TTLCache
 from fastapi import HTTPException, status
 from botocore.exceptions import ClientError
 
 # Import necessary models and utils
-from .collection_utils import collections_table, s3_client
+from .collection_utils import collections_table
 from constants import STORAGE_BUCKET_NAME  # Import constant directly
 from schemas.requests_responses import PresignUploadResponse
+from utils.s3_helpers import presign_s3_url
+
+logger = logging.getLogger(__name__)
+
+# Collections recently confirmed to exist, so bulk uploads skip the repeated check.
+# A collection deleted meanwhile can still be presigned for up to the TTL, but
+# the file is then rejected when it is added to the collection
+_COLLECTION_EXISTS: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+# Existence checks in flight, so concurrent uploads to one collection share a read
+_pending_checks: Dict[str, "asyncio.Future[bool]"] = {}
+
+
+async def _check_collection_exists(collection_id: str) -> bool:
+    """Reads the collection's id from DynamoDB, caching a positive result."""
+    response = await asyncio.to_thread(
+        collections_table.get_item,
+        Key={"id": collection_id},
+        ProjectionExpression="id",
+    )
+    exists = "Item" in response
+    if exists:
+        _COLLECTION_EXISTS[collection_id] = True
+    return exists
+
+
+async def _collection_exists(collection_id: str) -> bool:
+    """
+    Returns whether a collection exists, coalescing concurrent checks for it.
+
+    Callers arriving while a check is in flight await that same check instead of
+    issuing their own read; a ClientError from it is raised to each of them.
+    """
+    if collection_id in _COLLECTION_EXISTS:
+        return True
+    pending = _pending_checks.get(collection_id)
+    if pending is None:
+        pending = asyncio.ensure_future(_check_collection_exists(collection_id))
+        _pending_checks[collection_id] = pending
+        pending.add_done_callback(lambda _: _pending_checks.pop(collection_id, None))
+    # Shielded so one caller disconnecting doesn't cancel the check for the others
+    return await asyncio.shield(pending)
 
 
 async def presign_collection_file_upload(
@@ -17,19 +62,17 @@ async def presign_collection_file_upload(
     """
     # Validate that the collection exists
     try:
-        response = collections_table.get_item(
-            Key={"id": collection_id}, ProjectionExpression="id"
-        )
-        if "Item" not in response:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found"
-            )
+        exists = await _collection_exists(collection_id)
     except ClientError as e:
-        print(f"Error checking collection existence {collection_id}: {e}")
+        logger.exception("Error checking collection existence %s", collection_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error checking collection existence",
         ) from e
+    if not exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found"
+        )
 
     # Generate file ID and S3 key
     file_id = str(uuid.uuid4())
@@ -37,15 +80,13 @@ async def presign_collection_file_upload(
     current_time = int(time.time())
 
     try:
-        # Generate presigned URL for PUT
-        presigned_url = s3_client.generate_presigned_url(
-            "put_object",
-            Params={
-                "Bucket": STORAGE_BUCKET_NAME,
-                "Key": s3_key,
-                "ContentType": content_type,
-            },
-            ExpiresIn=3600,  # 1 hour
+        # Generate presigned URL for PUT, signed locally with the cached signing key
+        presigned_url = presign_s3_url(
+            "PUT",
+            STORAGE_BUCKET_NAME,
+            s3_key,
+            expires_in=3600,  # 1 hour
+            content_type=content_type,
         )
 
         return PresignUploadResponse(
@@ -60,16 +101,20 @@ async def presign_collection_file_upload(
             },
         )
     except ClientError as e:
-        print(
-            f"Error generating presigned URL for collection {collection_id}, file {filename}: {e}"
+        logger.exception(
+            "Error generating presigned URL for collection %s, file %s",
+            collection_id,
+            filename,
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to generate upload URL: {e.response['Error']['Message']}",
         ) from e
     except Exception as e:
-        print(
-            f"Unexpected error generating presigned URL for collection {collection_id}, file {filename}: {e}"
+        logger.exception(
+            "Unexpected error generating presigned URL for collection %s, file %s",
+            collection_id,
+            filename,
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
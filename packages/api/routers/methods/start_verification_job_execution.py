@@ -1,20 +1,42 @@
+import logging
+import asyncio
+import math
 import time
-from decimal import Decimal
 from fastapi import HTTPException, status
 from typing import Optional
+from boto3.dynamodb.conditions import Attr
 from botocore.exceptions import ClientError
 
 # Import necessary models and utils from the verification_job_utils
 from .verification_job_utils import (
     verification_jobs_table,
     dynamodb_item_to_verification_job,
-    model_to_dynamodb_item,
     queue_verification_job,  # Import the helper,
     collections_table
 )
 from schemas.datamodel import VerificationJobDto
 from schemas.requests_responses import VerificationJobResponse
 
+logger = logging.getLogger(__name__)
+
+
+def _get_collection_name(collection_id: str, verification_job_id: str) -> Optional[str]:
+    """Returns the description of the job's collection for the DTO, or None."""
+    try:
+        col_response = collections_table.get_item(Key={"id": collection_id})
+        col_item = col_response.get("Item")
+        if col_item:
+            desc_value = col_item.get('description')
+            return str(desc_value) if desc_value is not None else None
+    except ClientError as wo_e:
+        logger.warning(
+            "Error fetching collection %s for job %s DTO: %s",
+            collection_id,
+            verification_job_id,
+            wo_e,
+        )
+    return None
+
 
 async def start_verification_job_execution(
     verification_job_id: str,
@@ -24,57 +46,49 @@ async def start_verification_job_execution(
     Clears previous file check results before starting.
     """
     try:
-        # 1. Fetch the Verification Job
-        vj_response = verification_jobs_table.get_item(Key={"id": verification_job_id})
-        vj_item = vj_response.get("Item")
-        if not vj_item:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Verification job with ID {verification_job_id} not found",
+        # 1. Touch the Verification Job in place, reading back the whole job, rather
+        # than reading it and writing every attribute back
+        try:
+            vj_response = await asyncio.to_thread(
+                verification_jobs_table.update_item,
+                Key={"id": verification_job_id},
+                UpdateExpression="SET #updated_at = :updated_at",
+                ExpressionAttributeNames={"#updated_at": "updated_at"},
+                ExpressionAttributeValues={":updated_at": int(time.time())},
+                ConditionExpression=Attr("id").exists(),
+                ReturnValues="ALL_NEW",
             )
-        verification_job = dynamodb_item_to_verification_job(vj_item)
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Verification job with ID {verification_job_id} not found",
+                ) from e
+            raise
+        verification_job = dynamodb_item_to_verification_job(vj_response["Attributes"])
 
-        queue_verification_job(verification_job_id)
+        # 2. Queue the job and fetch the collection name concurrently
+        _, collection_name = await asyncio.gather(
+            asyncio.to_thread(queue_verification_job, verification_job_id),
+            asyncio.to_thread(
+                _get_collection_name, verification_job.collection_id, verification_job_id
+            ),
+        )
 
-        # 5. Update the job object
-        current_time = int(time.time())
-        verification_job.updated_at = current_time
+        # 3. Calculate cost for the DTO response
 
-        # 6. Save the updated job back to DynamoDB
-        updated_item_data = model_to_dynamodb_item(verification_job)
-        verification_jobs_table.put_item(Item=updated_item_data)
+        # Calculate total cost (will be 0 or None after clearing checks); fsum keeps
+        # float sums exact enough without parsing every cost into a Decimal
+        costs = [
+            file_check.cost
+            for file_instance in verification_job.files
+            for file_check in file_instance.file_checks or []
+            if file_check.cost is not None
+        ]
+        total_cost_val: Optional[float] = math.fsum(costs) if costs else None
 
-        # 7. Fetch collection name and calculate cost for the DTO response
-        collection_name: Optional[str] = None
-        try:
-            col_response = collections_table.get_item(
-                Key={"id": verification_job.collection_id}
-            )
-            col_item = col_response.get("Item")
-            if col_item:
-                desc_value = col_item.get('description')
-                collection_name = str(desc_value) if desc_value is not None else None
-        except ClientError as wo_e:
-            print(
-                f"Warning: Error fetching collection {verification_job.collection_id} for job {verification_job_id} DTO: {wo_e}"
-            )
-
-        # Calculate total cost (will be 0 or None after clearing checks)
-        total_cost_val: Optional[float] = None
-        if verification_job.files:
-            current_total = Decimal("0.0")
-            cost_found = False
-            for file_instance in verification_job.files:
-                if file_instance.file_checks:  # This list is now empty
-                    for file_check in file_instance.file_checks:
-                        if file_check.cost is not None:
-                            current_total += Decimal(str(file_check.cost))
-                            cost_found = True
-            if cost_found:
-                total_cost_val = float(current_total)
-
-        dto = VerificationJobDto(
-            **verification_job.model_dump(),
+        dto = VerificationJobDto.model_construct(
+            **verification_job.__dict__,
             collection_name=collection_name,
             total_cost=total_cost_val,
         )
@@ -84,8 +98,10 @@ async def start_verification_job_execution(
         raise e
     except ClientError as e:  # Catch DynamoDB or SFN describe_execution errors
         error_code = e.response.get("Error", {}).get("Code", "Unknown")
-        print(
-            f"AWS ClientError ({error_code}) starting execution for job {verification_job_id}: {e}"
+        logger.exception(
+            "AWS ClientError (%s) starting execution for job %s",
+            error_code,
+            verification_job_id,
         )
         if error_code == "ResourceNotFoundException":
             raise HTTPException(
@@ -99,7 +115,9 @@ async def start_verification_job_execution(
                 detail=f"Database error during job start: {error_message}",
             ) from e
     except Exception as e:
-        print(f"Unexpected error starting execution for job {verification_job_id}: {e}")
+        logger.exception(
+            "Unexpected error starting execution for job %s", verification_job_id
+        )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred during job start: {str(e)}",
@@ -1,9 +1,19 @@
+import logging
+import asyncio
 import time
+from typing import Any, Dict
 from fastapi import HTTPException, status
+from boto3.dynamodb.conditions import Attr
 from botocore.exceptions import ClientError
 from schemas.datamodel import Agent, AgentTypes
 from schemas.requests_responses import UpdateAgentRequest
-from .agent_utils import agent_table, agent_to_dynamodb_item, dynamodb_item_to_agent
+from .agent_utils import (
+    agent_table,
+    dynamodb_item_to_agent,
+    invalidate_agent_cache,
+)
+
+logger = logging.getLogger(__name__)
 
 
 async def update_agent(agent_id: str, agent_request: UpdateAgentRequest) -> Agent:
@@ -18,50 +28,48 @@ async def update_agent(agent_id: str, agent_request: UpdateAgentRequest) -> Agen
         Agent: The updated Agent object.
     """
     try:
-        # First, get the existing agent
-        response = agent_table.get_item(Key={"id": agent_id})
-        
-        if "Item" not in response:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Agent with ID {agent_id} not found",
-            )
-        
-        existing_agent = dynamodb_item_to_agent(response["Item"])
-        
-        # Update fields if provided
-        updated_data = {
-            "id": agent_id,
-            "created_at": existing_agent.created_at,
-            "updated_at": int(time.time()),
-            "name": agent_request.name if agent_request.name is not None else existing_agent.name,
-            "description": agent_request.description if agent_request.description is not None else existing_agent.description,
-            "prompt": agent_request.prompt if agent_request.prompt is not None else existing_agent.prompt,
-            "type": AgentTypes(agent_request.type) if agent_request.type is not None else existing_agent.type,
-            "api_endpoint": agent_request.api_endpoint if agent_request.api_endpoint is not None else existing_agent.api_endpoint,
-            "knowledge_base_id": agent_request.knowledge_base_id if agent_request.knowledge_base_id is not None else existing_agent.knowledge_base_id,
-            "athena_database": agent_request.athena_database if agent_request.athena_database is not None else existing_agent.athena_database,
-            "athena_query": agent_request.athena_query if agent_request.athena_query is not None else existing_agent.athena_query,
-        }
-        
-        updated_agent = Agent(**updated_data)
-        
-        # Save the updated agent
-        agent_data = agent_to_dynamodb_item(updated_agent)
-        agent_table.put_item(Item=agent_data)
-        
-        return updated_agent
+        # Only the provided fields are set, in a single conditional update, so there
+        # is no read-modify-write window in which a concurrent update could be lost
+        update_data = agent_request.model_dump(exclude_none=True)
+        if "type" in update_data:
+            update_data["type"] = AgentTypes(update_data["type"]).value
+
+        update_expression_parts = ["#updated_at = :updated_at"]
+        expression_attribute_names = {"#updated_at": "updated_at"}
+        expression_attribute_values: Dict[str, Any] = {":updated_at": int(time.time())}
+        for key, value in update_data.items():
+            expression_attribute_names[f"#{key}"] = key
+            expression_attribute_values[f":{key}"] = value
+            update_expression_parts.append(f"#{key} = :{key}")
+
+        response = await asyncio.to_thread(
+            agent_table.update_item,
+            Key={"id": agent_id},
+            UpdateExpression="SET " + ", ".join(update_expression_parts),
+            ExpressionAttributeNames=expression_attribute_names,
+            ExpressionAttributeValues=expression_attribute_values,
+            ConditionExpression=Attr("id").exists(),
+            ReturnValues="ALL_NEW",
+        )
+        invalidate_agent_cache(agent_id)
+
+        return dynamodb_item_to_agent(response["Attributes"])
         
     except HTTPException:
         raise
     except ClientError as e:
-        print(f"Error updating Agent {agent_id}: {e}")
+        if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Agent with ID {agent_id} not found",
+            ) from e
+        logger.exception("Error updating Agent %s", agent_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update Agent: {str(e)}",
         ) from e
     except Exception as e:
-        print(f"Unexpected error updating Agent {agent_id}: {e}")
+        logger.exception("Unexpected error updating Agent %s", agent_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}",
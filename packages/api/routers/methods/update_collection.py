@@ -1,15 +1,22 @@
+import logging
+import asyncio
 import time
 from decimal import Decimal
 from enum import Enum
-from typing import cast, Any  # Import cast and Any
+from typing import cast, Any, Dict  # Import cast and Any
 from fastapi import HTTPException, status
 from botocore.exceptions import ClientError
 from boto3.dynamodb.conditions import Attr
 
 # Import necessary models and utils
-from .collection_utils import collections_table, dynamodb_item_to_collection
+from .collection_utils import (
+    collections_table,
+    dynamodb_item_to_collection,
+)
 from schemas.requests_responses import UpdateCollectionRequest, UpdateCollectionResponse
 
+logger = logging.getLogger(__name__)
+
 
 async def update_collection(
     collection_id: str, collection_request: UpdateCollectionRequest
@@ -19,20 +26,17 @@ async def update_collection(
     Note: This does not currently support updating the embedded Item instances.
     """
     try:
-        update_expression_parts = []
-        expression_attribute_values = {}
-        expression_attribute_names = {}
-
-        current_time = int(time.time())
-        update_expression_parts.append("#updated_at = :updated_at")
-        expression_attribute_names["#updated_at"] = "updated_at"
-        expression_attribute_values[":updated_at"] = current_time
-
         # Exclude 'items' and 'files' from direct update via this method for simplicity
         update_data = collection_request.model_dump(
             exclude_unset=True, exclude={"items", "files"}
         )
 
+        # updated_at is always set, so an empty update is just a touch that still
+        # returns the whole collection from the same update_item call
+        update_expression_parts = ["#updated_at = :updated_at"]
+        expression_attribute_names = {"#updated_at": "updated_at"}
+        expression_attribute_values: Dict[str, Any] = {":updated_at": int(time.time())}
+
         for key, value in update_data.items():
             attr_name_placeholder = f"#{key}"
             attr_value_placeholder = f":{key}"
@@ -62,20 +66,10 @@ async def update_collection(
                 Any, converted_value
             )
 
-        if (
-            not expression_attribute_values or len(expression_attribute_values) == 1
-        ):  # Only timestamp updated
-            response = collections_table.get_item(Key={"id": collection_id})
-            item = response.get("Item")
-            if not item:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found"
-                )
-            return UpdateCollectionResponse(collection=dynamodb_item_to_collection(item))
-
         update_expression = "SET " + ", ".join(update_expression_parts)
 
-        response = collections_table.update_item(
+        response = await asyncio.to_thread(
+            collections_table.update_item,
             Key={"id": collection_id},
             UpdateExpression=update_expression,
             ExpressionAttributeNames=expression_attribute_names,
@@ -83,12 +77,11 @@ async def update_collection(
             ReturnValues="ALL_NEW",
             ConditionExpression=Attr("id").exists(),
         )
-        return UpdateCollectionResponse(
-            collection=dynamodb_item_to_collection(response["Attributes"])
-        )
+        collection = dynamodb_item_to_collection(response["Attributes"])
+        return UpdateCollectionResponse(collection=collection)
 
     except ClientError as e:
-        print(f"Error updating collection {collection_id}: {e}")
+        logger.exception("Error updating collection %s", collection_id)
         if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found"
@@ -99,7 +92,7 @@ async def update_collection(
                 detail=f"Failed to update collection: {e.response['Error']['Message']}",
             ) from e
     except Exception as e:
-        print(f"Unexpected error updating collection {collection_id}: {e}")
+        logger.exception("Unexpected error updating collection %s", collection_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}",
@@ -1,3 +1,4 @@
+import asyncio
 import time
 from decimal import Decimal
 from fastapi import HTTPException, status
@@ -79,7 +80,9 @@ async def update_item(item_id: str, item_request: UpdateItemRequest) -> Item:
             ):  # No fields provided at all
                 # Maybe return current item or raise 400 Bad Request?
                 # Let's fetch and return the current item
-                response = item_table.get_item(Key={"id": item_id})
+                response = await asyncio.to_thread(
+                    item_table.get_item, Key={"id": item_id}
+                )
                 item = response.get("Item")
                 if not item:
                     raise HTTPException(
@@ -90,7 +93,8 @@ async def update_item(item_id: str, item_request: UpdateItemRequest) -> Item:
 
         update_expression = "SET " + ", ".join(update_expression_parts)
 
-        response = item_table.update_item(
+        response = await asyncio.to_thread(
+            item_table.update_item,
             Key={"id": item_id},
             UpdateExpression=update_expression,
             ExpressionAttributeNames=expression_attribute_names,
@@ -1,3 +1,4 @@
+import asyncio
 import time
 from decimal import Decimal
 from fastapi import HTTPException, status
@@ -75,7 +76,9 @@ async def update_verification_job(
             and "#updated_at" in expression_attribute_names
         ):
             # Only timestamp updated or nothing changed
-            response = verification_jobs_table.get_item(Key={"id": verification_job_id})
+            response = await asyncio.to_thread(
+                verification_jobs_table.get_item, Key={"id": verification_job_id}
+            )
             item = response.get("Item")
             if not item:
                 raise HTTPException(
@@ -88,7 +91,8 @@ async def update_verification_job(
 
         update_expression = "SET " + ", ".join(update_expression_parts)
 
-        response = verification_jobs_table.update_item(
+        response = await asyncio.to_thread(
+            verification_jobs_table.update_item,
             Key={"id": verification_job_id},
             UpdateExpression=update_expression,
             ExpressionAttributeNames=expression_attribute_names,
@@ -1,11 +1,17 @@
-import boto3
+import asyncio
 import json
+import logging
 from decimal import Decimal
-from typing import Any, cast, Dict
+from typing import Any, cast, Dict, Iterable, List, Optional
 from pydantic import BaseModel
-from enum import Enum
 
+from aws_clients import dynamodb, dynamodb_client, sqs_client
 from constants import STORAGE_BUCKET_NAME
+from .collection_utils import (
+    batch_get_items,
+    dynamodb_items_to_models,
+    to_attribute_values,
+)
 from botocore.exceptions import ClientError
 
 # Import necessary models and constants from the main project structure
@@ -21,22 +27,22 @@ from schemas.datamodel import (
     VerificationJobLogEntry,
 )
 from constants import (
-    AWS_REGION,
     VERIFICATION_JOBS_TABLE_NAME,
     PROCESSING_QUEUE_URL,
     COLLECTIONS_TABLE_NAME,
     VERIFICATION_JOB_LOGS_TABLE_NAME,
     FILE_CHECKS_TABLE_NAME,
+    JOB_ITEMS_TABLE_NAME,
 )
 
+logger = logging.getLogger(__name__)
+
 # Initialize AWS clients
-dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
 collections_table = dynamodb.Table(COLLECTIONS_TABLE_NAME)
-sqs_client = boto3.client("sqs", region_name=AWS_REGION)
-s3_client = boto3.client("s3", region_name=AWS_REGION)
 verification_jobs_table = dynamodb.Table(VERIFICATION_JOBS_TABLE_NAME)
 verification_job_logs_table = dynamodb.Table(VERIFICATION_JOB_LOGS_TABLE_NAME)
 file_checks_table = dynamodb.Table(FILE_CHECKS_TABLE_NAME)
+job_items_table = dynamodb.Table(JOB_ITEMS_TABLE_NAME)
 
 # --- Helper Functions for DynamoDB <-> Pydantic Conversion ---
 
@@ -63,8 +69,8 @@ def dynamodb_item_to_verification_job(item: dict) -> VerificationJob:
         try:
             item["status"] = AssessmentStatus(item["status"])
         except ValueError:
-            print(
-                f"Warning: Invalid status value '{item['status']}' found for job {item.get('id')}"
+            logger.warning(
+                "Invalid status value %r found for job %s", item["status"], item.get("id")
             )
             item["status"] = AssessmentStatus.PENDING
     # Handle nested ItemInstance status
@@ -78,8 +84,10 @@ def dynamodb_item_to_verification_job(item: dict) -> VerificationJob:
                         item_instance_data["status"]
                     )
                 except ValueError:
-                    print(
-                        f"Warning: Invalid status value '{item_instance_data['status']}' found for item instance {item_instance_data.get('id')}"
+                    logger.warning(
+                        "Invalid status value %r found for item instance %s",
+                        item_instance_data["status"],
+                        item_instance_data.get("id"),
                     )
                     item_instance_data["status"] = AssessmentStatus.PENDING
     # Ensure nested ItemInstance models are correctly parsed if they exist
@@ -103,8 +111,11 @@ def dynamodb_item_to_verification_job(item: dict) -> VerificationJob:
                 try:
                     file_data["status"] = CollectionFileStatus(file_data["status"])
                 except ValueError:
-                    print(
-                        f"Warning: Invalid status value '{file_data['status']}' found for file {file_data.get('id')} in job {item.get('id')}"
+                    logger.warning(
+                        "Invalid status value %r found for file %s in job %s",
+                        file_data["status"],
+                        file_data.get("id"),
+                        item.get("id"),
                     )
                     file_data["status"] = (
                         None  # Or a default status like CollectionFileStatus.PENDING
@@ -131,6 +142,16 @@ def dynamodb_item_to_verification_job_log_entry(item: dict) -> VerificationJobLo
     return VerificationJobLogEntry(**item)
 
 
+def dynamodb_items_to_verification_job_log_entries(
+    items: list[dict],
+) -> list[VerificationJobLogEntry]:
+    """Converts a page of DynamoDB items to log entries in one validation pass."""
+    return cast(
+        list[VerificationJobLogEntry],
+        dynamodb_items_to_models(items, VerificationJobLogEntry),
+    )
+
+
 def dynamodb_item_to_collection(item: dict) -> Collection:
     """Converts a DynamoDB item to a Collection Pydantic model."""
     item = parse_decimal(item)  # Convert Decimals first
@@ -141,8 +162,10 @@ def dynamodb_item_to_collection(item: dict) -> Collection:
                 try:
                     file_data["status"] = CollectionFileStatus(file_data["status"])
                 except ValueError:
-                    print(
-                        f"Warning: Invalid status value '{file_data['status']}' found for file {file_data.get('id')}"
+                    logger.warning(
+                        "Invalid status value %r found for file %s",
+                        file_data["status"],
+                        file_data.get("id"),
                     )
                     file_data["status"] = None  # Or a default status if applicable
     # Ensure nested Item models are correctly parsed
@@ -170,29 +193,17 @@ def dynamodb_item_to_collection(item: dict) -> Collection:
 
 def model_to_dynamodb_item(model_instance: BaseModel) -> dict[str, Any]:
     """Converts a Pydantic model instance to a DynamoDB compatible dictionary."""
-    # Use exclude_none=True to avoid writing null values, which DynamoDB doesn't like unless specified in schema
-    item = model_instance.model_dump(mode="json", exclude_none=True)
-
-    # Recursively convert floats to Decimals and enums to strings
-    def convert_values(data: Any) -> Any:
-        if isinstance(data, dict):
-            return {k: convert_values(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [convert_values(elem) for elem in data]
-        elif isinstance(data, float):
-            # Use context for precision if needed, otherwise default is usually fine
-            return Decimal(str(data))
-        elif isinstance(data, Enum):
-            return data.value
-        else:
-            return data
-
-    # Cast the result of the recursive helper
-    return cast(Dict[str, Any], convert_values(item))
+    # Use exclude_none=True to avoid writing null values, which DynamoDB doesn't like unless specified in schema.
+    # Serialising to JSON in pydantic-core and parsing floats straight into Decimals converts the
+    # whole tree (enums included) in one native pass, rather than walking every nested item and file
+    return cast(
+        Dict[str, Any],
+        json.loads(model_instance.model_dump_json(exclude_none=True), parse_float=Decimal),
+    )
 
 
 # --- Helper Function to fetch file checks ---
-def fetch_file_checks_for_job(
+async def fetch_file_checks_for_job(
     verification_job_id: str, verification_job: VerificationJob
 ):
     """
@@ -203,28 +214,38 @@ def fetch_file_checks_for_job(
         # Only proceed if there are Items and files in the job
         if verification_job.items and verification_job.files:
             # Get all Item instance IDs
-            item_instance_ids = [item.id for item in verification_job.items]
+            item_instance_ids = list(dict.fromkeys(item.id for item in verification_job.items))
+
+            # Fetch every Item instance's file checks with BatchGetItem, keyed by
+            # verification_job_id and item_instance_id
+            file_check_records = await batch_get_items(
+                FILE_CHECKS_TABLE_NAME,
+                [
+                    {
+                        "verification_job_id": verification_job_id,
+                        "item_instance_id": item_instance_id,
+                    }
+                    for item_instance_id in item_instance_ids
+                ],
+            )
+            records_by_item_instance_id = {
+                record["item_instance_id"]: record for record in file_check_records
+            }
 
-            # For each Item instance, fetch file checks
+            # Attach the file checks in Item order
             for item_instance_id in item_instance_ids:
                 try:
-                    # Get file checks from file_checks table using verification_job_id and item_instance_id
-                    response = file_checks_table.get_item(
-                        Key={
-                            "verification_job_id": verification_job_id,
-                            "item_instance_id": item_instance_id,
-                        }
-                    )
-
-                    item = response.get("Item")
+                    item = records_by_item_instance_id.get(item_instance_id)
                     if (
                         item
                         and "file_checks" in item
                         and isinstance(item["file_checks"], list)
                     ):
                         file_checks_list = parse_decimal(item["file_checks"])
-                        print(
-                            f"Found {len(file_checks_list)} file checks for Item {item_instance_id}"
+                        logger.debug(
+                            "Found %d file checks for Item %s",
+                            len(file_checks_list),
+                            item_instance_id,
                         )
 
                         # Group file checks by file_instance_id
@@ -250,8 +271,9 @@ def fetch_file_checks_for_job(
                                                 check["status"]
                                             )
                                         except ValueError:
-                                            print(
-                                                f"Warning: Invalid status value '{check['status']}' in file check"
+                                            logger.warning(
+                                                "Invalid status value %r in file check",
+                                                check["status"],
                                             )
                                             check["status"] = None
 
@@ -273,17 +295,44 @@ def fetch_file_checks_for_job(
                                     )
                                     file.file_checks.append(file_check)
 
-                except Exception as e:
-                    print(f"Error fetching file checks for Item {item_instance_id}: {e}")
+                except Exception:
+                    logger.exception(
+                        "Error processing file checks for Item %s", item_instance_id
+                    )
 
         return verification_job
-    except Exception as e:
-        print(f"Unexpected error in fetch_file_checks_for_job: {e}")
+    except Exception:
+        logger.exception("Unexpected error in fetch_file_checks_for_job")
         return verification_job  # Return the original job without file checks in case of error
 
 
+def _fetch_collection_name(
+    collection_id: str, verification_job_id: str
+) -> Optional[str]:
+    """Returns the description of a job's collection, or None if it can't be read."""
+    try:
+        col_response = collections_table.get_item(Key={"id": collection_id})
+        col_item = col_response.get("Item")
+        if col_item:
+            collection = dynamodb_item_to_collection(col_item)
+            return collection.description  # Use description if available
+        logger.warning(
+            "Associated collection %s not found for verification job %s",
+            collection_id,
+            verification_job_id,
+        )
+    except Exception:
+        logger.warning(
+            "Error fetching collection %s for verification job %s",
+            collection_id,
+            verification_job_id,
+            exc_info=True,
+        )
+    return None
+
+
 # --- Helper Function to fetch a verification job with associated data ---
-def fetch_verification_job(verification_job_id: str):
+async def fetch_verification_job(verification_job_id: str):
     """
     Retrieves a verification job along with associated data (collection name, file checks, total cost).
 
@@ -298,7 +347,9 @@ def fetch_verification_job(verification_job_id: str):
     """
     try:
         # 1. Fetch the Verification Job
-        vj_response = verification_jobs_table.get_item(Key={"id": verification_job_id})
+        vj_response = await asyncio.to_thread(
+            verification_jobs_table.get_item, Key={"id": verification_job_id}
+        )
         vj_item = vj_response.get("Item")
         if not vj_item:
             raise ValueError(
@@ -306,32 +357,17 @@ def fetch_verification_job(verification_job_id: str):
             )
 
         verification_job = dynamodb_item_to_verification_job(vj_item)
-        # 1b. Fetch file checks for this job from file_checks table
-        verification_job = fetch_file_checks_for_job(
-            verification_job_id, verification_job
-        )
 
-        # 2. Fetch the corresponding Collection name
-        collection_name = None  # Default to None
-        try:
-            col_response = collections_table.get_item(
-                Key={"id": verification_job.collection_id}
-            )
-            col_item = col_response.get("Item")
-            if col_item:
-                collection = dynamodb_item_to_collection(col_item)
-                collection_name = (
-                    collection.description
-                )  # Use description if available
-            else:
-                print(
-                    f"Warning: Associated collection {verification_job.collection_id} not found for verification job {verification_job_id}"
-                )
-        except Exception as col_e:
-            print(
-                f"Warning: Error fetching collection {verification_job.collection_id} for verification job {verification_job_id}: {col_e}"
-            )
-            # Continue with None collection_name
+        # 2. The file checks and the collection name only depend on the job, so
+        # they are fetched concurrently (a missing collection leaves the name None)
+        verification_job, collection_name = await asyncio.gather(
+            fetch_file_checks_for_job(verification_job_id, verification_job),
+            asyncio.to_thread(
+                _fetch_collection_name,
+                verification_job.collection_id,
+                verification_job_id,
+            ),
+        )
 
         return verification_job, collection_name
 
@@ -339,8 +375,9 @@ def fetch_verification_job(verification_job_id: str):
         # Re-raise ValueError for specific handling by the API endpoint
         raise
     except Exception as e:
-        print(
-            f"Unexpected error retrieving verification job {verification_job_id} with associated data: {e}"
+        logger.exception(
+            "Unexpected error retrieving verification job %s with associated data",
+            verification_job_id,
         )
         raise Exception(
             f"An unexpected error occurred while retrieving verification job: {str(e)}"
@@ -379,7 +416,7 @@ def save_verification_job_without_file_checks(
     # Save the job to DynamoDB
     verification_jobs_table.put_item(Item=job_item)
 
-    print(f"Saved verification job {job_to_save.id} without file_checks")
+    logger.info("Saved verification job %s without file_checks", job_to_save.id)
 
     # Return the modified job (with empty file_checks)
     return job_to_save
@@ -404,14 +441,84 @@ def save_verification_job_to_dynamodb(
     # Save the job to DynamoDB
     verification_jobs_table.put_item(Item=job_item)
 
-    print(f"Saved verification job {verification_job.id} to DynamoDB")
+    logger.info("Saved verification job %s to DynamoDB", verification_job.id)
 
     # Return the original job
     return verification_job
 
 
+def link_job_items(verification_job_id: str, item_ids: Iterable[str]) -> None:
+    """Records which Items a verification job uses in the job items lookup table."""
+    with job_items_table.batch_writer(
+        overwrite_by_pkeys=["item_id", "verification_job_id"]
+    ) as writer:
+        for item_id in set(item_ids):
+            writer.put_item(
+                Item={"item_id": item_id, "verification_job_id": verification_job_id}
+            )
+
+
+# DynamoDB allows at most 100 actions per transaction; one is the job itself
+MAX_LINKED_ITEMS_PER_JOB = 99
+
+
+def put_job_with_item_links(job_item: Dict[str, Any], item_ids: Iterable[str]) -> None:
+    """
+    Stores a new verification job and its job items links in one transaction.
+
+    The job is only written if its ID is unused, and the links are written with it,
+    so neither can exist without the other. Raises ClientError with the code
+    TransactionCanceledException when the ID is taken. At most
+    MAX_LINKED_ITEMS_PER_JOB distinct Items fit in the transaction.
+    """
+    transact_items: List[Dict[str, Any]] = [
+        {
+            "Put": {
+                "TableName": verification_jobs_table.name,
+                "Item": to_attribute_values(job_item),
+                "ConditionExpression": "attribute_not_exists(#id)",
+                "ExpressionAttributeNames": {"#id": "id"},
+            }
+        }
+    ]
+    transact_items.extend(
+        {
+            "Put": {
+                "TableName": job_items_table.name,
+                "Item": to_attribute_values(
+                    {"item_id": item_id, "verification_job_id": job_item["id"]}
+                ),
+            }
+        }
+        for item_id in set(item_ids)
+    )
+    dynamodb_client.transact_write_items(TransactItems=transact_items)
+
+
+def unlink_job_items(verification_job_id: str, item_ids: Iterable[str]) -> None:
+    """Removes a verification job's entries from the job items lookup table."""
+    with job_items_table.batch_writer(
+        overwrite_by_pkeys=["item_id", "verification_job_id"]
+    ) as writer:
+        for item_id in set(item_ids):
+            writer.delete_item(
+                Key={"item_id": item_id, "verification_job_id": verification_job_id}
+            )
+
+
 # --- Helper Function to Send Message to SQS Queue ---
 # Note: This function now raises HTTPException directly for easier handling in route implementations
+def warm_sqs_connection() -> None:
+    """Opens the SQS connection ahead of the first job so its send skips the TLS handshake."""
+    try:
+        sqs_client.get_queue_attributes(
+            QueueUrl=PROCESSING_QUEUE_URL, AttributeNames=["QueueArn"]
+        )
+    except Exception:
+        # Warming is best effort; a failure here surfaces on the first real send instead
+        logger.warning("Failed to warm SQS connection", exc_info=True)
+
+
 def queue_verification_job(job_id: str) -> str:
     """Sends a message to the SQS queue for the given job ID."""
     # Import HTTPException and status here as it's only used in this function within utils
@@ -437,13 +544,13 @@ def queue_verification_job(job_id: str) -> str:
         # Return the message ID
         return str(sqs_response["MessageId"])
     except ClientError as e:
-        print(f"AWS ClientError sending message to SQS for job {job_id}: {e}")
+        logger.exception("Error sending message to SQS for job %s", job_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to queue job for processing: {e.response['Error']['Message']}",
         ) from e
     except Exception as e:
-        print(f"Unexpected error sending message to SQS for job {job_id}: {e}")
+        logger.exception("Unexpected error sending message to SQS for job %s", job_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred while queueing the job: {str(e)}",
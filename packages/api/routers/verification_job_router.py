@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Path, Query, Body, status
+from fastapi import APIRouter, Path, Query, Body, Response, status
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 from schemas.datamodel import AssessmentStatus, VerificationJobDto  # Import DTO
 from schemas.requests_responses import (
@@ -14,6 +15,7 @@ from schemas.requests_responses import (
 # Import implementation functions from the methods directory
 from .methods.list_verification_jobs import (
     list_verification_jobs as list_verification_jobs_impl,
+    stream_verification_jobs as stream_verification_jobs_impl,
 )
 from .methods.get_verification_job import (
     get_verification_job as get_verification_job_impl,
@@ -51,21 +53,64 @@ async def list_verification_jobs(
     collection_id: Optional[str] = Query(  # noqa: B008
         None, description="Filter verification jobs by collection ID"
     ),
+    created_after: Optional[int] = Query(  # noqa: B008
+        None, description="Only return jobs created after this Unix timestamp"
+    ),
 ) -> List[VerificationJobDto]:
     """
     Retrieves a list of verification jobs, optionally filtered by status or collection ID.
 
-    Includes the associated collection name in the response DTOs.
+    Includes the associated collection name in the response DTOs. Jobs filtered by
+    collection are returned newest first.
 
     Args:
         filter_status (Optional[AssessmentStatus]): Filter jobs by their assessment status.
         collection_id (Optional[str]): Filter jobs associated with a specific collection ID.
+        created_after (Optional[int]): Only return jobs created after this Unix timestamp.
 
     Returns:
         List[VerificationJobDto]: A list of verification job data transfer objects matching the criteria.
     """
     return await list_verification_jobs_impl(
-        filter_status=filter_status, collection_id=collection_id
+        filter_status=filter_status,
+        collection_id=collection_id,
+        created_after=created_after,
+    )
+
+
+@router.get("/stream")
+async def stream_verification_jobs(
+    filter_status: Optional[AssessmentStatus] = Query(  # noqa: B008
+        None, alias="status", description="Filter verification jobs by status"
+    ),
+    collection_id: Optional[str] = Query(  # noqa: B008
+        None, description="Filter verification jobs by collection ID"
+    ),
+    created_after: Optional[int] = Query(  # noqa: B008
+        None, description="Only return jobs created after this Unix timestamp"
+    ),
+) -> StreamingResponse:
+    """
+    Streams verification jobs as newline-delimited JSON, one job DTO per line.
+
+    Jobs are sent as each page is read, so clients can start consuming large
+    listings before the whole table has been read.
+
+    Args:
+        filter_status (Optional[AssessmentStatus]): Filter jobs by their assessment status.
+        collection_id (Optional[str]): Filter jobs associated with a specific collection ID.
+        created_after (Optional[int]): Only return jobs created after this Unix timestamp.
+
+    Returns:
+        StreamingResponse: An application/x-ndjson stream of VerificationJobDto objects.
+    """
+    return StreamingResponse(
+        await stream_verification_jobs_impl(
+            filter_status=filter_status,
+            collection_id=collection_id,
+            created_after=created_after,
+        ),
+        media_type="application/x-ndjson",
     )
 
 
@@ -98,7 +143,7 @@ async def create_verification_job(
     job_request: CreateVerificationJobRequest = Body(  # noqa: B008
         ..., description="The verification job to create"
     ),
-) -> CreateVerificationJobResponse:
+) -> Response:
     """
     Creates a new verification job based on the provided request data.
 
@@ -113,7 +158,14 @@ async def create_verification_job(
         CreateVerificationJobResponse: The response containing the details of the
                                        newly created verification job.
     """
-    return await create_verification_job_impl(job_request=job_request)
+    response = await create_verification_job_impl(job_request=job_request)
+    # The job was just built from validated models, so serialise it once directly
+    # instead of letting FastAPI re-validate the whole job against response_model
+    return Response(
+        content=response.model_dump_json(),
+        media_type="application/json",
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.post(
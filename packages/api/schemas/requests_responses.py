@@ -19,6 +19,10 @@ class ItemListResponse(BaseModel):
     """
 
     items: List[Item]
+    last_evaluated_key: Optional[Dict[str, Any]] = Field(
+        None,
+        description="The key to use for fetching the next page of results, if any.",
+    )
 
 class CollectionsListResponse(BaseModel):
     """
@@ -29,6 +33,10 @@ class CollectionsListResponse(BaseModel):
     """
 
     items: List[Collection]
+    last_evaluated_key: Optional[Dict[str, Any]] = Field(
+        None,
+        description="The key to use for fetching the next page of results, if any.",
+    )
 
 
 class CollectionResponse(BaseModel):
@@ -103,6 +111,10 @@ class AddFileRequest(BaseModel):
     filename: str
     status: Optional[AssessmentStatus] = None
     status_reasoning: Optional[str] = None
+    size: Optional[int] = Field(
+        None,
+        description="Optional size of the uploaded file in bytes. When provided, the S3 metadata lookup is skipped.",
+    )
 
 
 class AddFileResponse(BaseModel):
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Script to backfill the job items lookup table from existing verification jobs.
+Run this once after deploying the table so Items used by older jobs stay protected.
+"""
+
+import os
+import sys
+import logging
+
+# Add the parent directory to the path so we can import from packages/api
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from routers.methods.verification_job_utils import (
+    verification_jobs_table,
+    link_job_items,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def backfill_job_items():
+    """
+    Scan every verification job and record the Items it uses.
+    """
+    scan_kwargs = {
+        "ProjectionExpression": "id, #items",
+        "ExpressionAttributeNames": {"#items": "items"},
+    }
+    job_count = 0
+    while True:
+        response = verification_jobs_table.scan(**scan_kwargs)
+        for job in response.get("Items", []):
+            item_ids = [
+                instance["item_id"]
+                for instance in job.get("items", [])
+                if isinstance(instance, dict) and instance.get("item_id")
+            ]
+            if item_ids:
+                link_job_items(job["id"], item_ids)
+            job_count += 1
+        if "LastEvaluatedKey" not in response:
+            break
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    logger.info(f"Backfilled job items for {job_count} verification jobs.")
+
+
+if __name__ == "__main__":
+    backfill_job_items()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Script to backfill the level_ts attribute on existing verification job log entries.
+Run this once after deploying the job-level-ts-index GSI so older logs can be filtered by level.
+"""
+
+import os
+import sys
+import logging
+
+# Add the parent directory to the path so we can import from packages/api
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from routers.methods.verification_job_utils import verification_job_logs_table
+from utils.log_util import level_timestamp_key
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def backfill_log_level_ts():
+    """
+    Scan every log entry and set level_ts where it is missing.
+    """
+    scan_kwargs = {
+        "ProjectionExpression": "id, #ts, #lvl, level_ts",
+        "ExpressionAttributeNames": {"#ts": "timestamp", "#lvl": "level"},
+    }
+    updated_count = 0
+    while True:
+        response = verification_job_logs_table.scan(**scan_kwargs)
+        for entry in response.get("Items", []):
+            if "level_ts" in entry or "level" not in entry:
+                continue
+            verification_job_logs_table.update_item(
+                Key={"id": entry["id"], "timestamp": entry["timestamp"]},
+                UpdateExpression="SET level_ts = :level_ts",
+                ExpressionAttributeValues={
+                    ":level_ts": level_timestamp_key(
+                        entry["level"], int(entry["timestamp"])
+                    )
+                },
+            )
+            updated_count += 1
+        if "LastEvaluatedKey" not in response:
+            break
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    logger.info(f"Backfilled level_ts for {updated_count} log entries.")
+
+
+if __name__ == "__main__":
+    backfill_log_level_ts()
@@ -0,0 +1,4 @@
+import os
+
+# Modules under test create boto3 clients at import time, which need a region
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-west-2")
@@ -0,0 +1,132 @@
+import asyncio
+from decimal import Decimal
+from unittest.mock import patch
+
+from routers.methods import collection_utils
+from routers.methods.collection_utils import dynamodb_item_to_model, dynamodb_items_to_models
+from schemas.datamodel import Item
+
+
+def test_page_conversion_matches_per_item_conversion():
+    """The TypeAdapter page path produces the same models as the per-item converter."""
+    records = [
+        {
+            "id": item_id,
+            "created_at": Decimal(1),
+            "updated_at": Decimal(2),
+            "name": "Fence",
+            "description": "A fence panel",
+            "label_filtering_rules": [
+                {
+                    "id": "rule-1",
+                    "created_at": Decimal(1),
+                    "updated_at": Decimal(1),
+                    "image_labels": ["Fence"],
+                    "min_confidence": Decimal("0.75"),
+                }
+            ],
+        }
+        for item_id in ("a", "b")
+    ]
+    models = dynamodb_items_to_models(records, Item)
+
+    assert models == [dynamodb_item_to_model(record, Item) for record in records]
+    assert models[0].label_filtering_rules[0].min_confidence == 0.75
+
+
+def test_limiter_shrinks_on_throttle_and_grows_after_successes():
+    """The limit halves when throttled and rises by one after a run of successes."""
+    limiter = collection_utils.AIMDLimiter(initial=8, minimum=1, maximum=10, increase_after=3)
+
+    limiter.on_throttle()
+    assert limiter.limit == 4
+    for _ in range(3):
+        limiter.on_throttle()
+    assert limiter.limit == 1
+
+    for _ in range(2):
+        limiter.on_ok()
+    assert limiter.limit == 1
+    limiter.on_ok()
+    assert limiter.limit == 2
+
+    limiter.limit = 10
+    for _ in range(3):
+        limiter.on_ok()
+    assert limiter.limit == 10
+
+
+def test_limiter_caps_concurrency_across_event_loops():
+    """At most `limit` holders run at once, and the limiter works on a fresh loop."""
+    limiter = collection_utils.AIMDLimiter(initial=2)
+
+    async def run() -> int:
+        in_flight = peak = 0
+
+        async def hold() -> None:
+            nonlocal in_flight, peak
+            async with limiter:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.wait_for(asyncio.gather(*(hold() for _ in range(6))), 2)
+        return peak
+
+    assert asyncio.run(run()) == 2
+    assert asyncio.run(run()) == 2
+
+
+def test_batch_backoff_does_not_hold_a_slot():
+    """A chunk sleeping before its retry lets other chunks use the limiter."""
+    calls = []
+
+    def batch_get_item(RequestItems):
+        keys = RequestItems["jobs"]["Keys"]
+        calls.append(keys)
+        if len(calls) == 1:
+            return {"Responses": {}, "UnprocessedKeys": {"jobs": {"Keys": keys}}}
+        return {"Responses": {"jobs": keys}}
+
+    async def run():
+        retried = asyncio.create_task(
+            collection_utils.batch_get_items("jobs", [{"id": "a"}])
+        )
+        await asyncio.sleep(0.05)
+        other = await collection_utils.batch_get_items("jobs", [{"id": "b"}])
+        return retried.done(), other, await retried
+
+    with patch.object(
+        collection_utils, "batch_get_limiter", collection_utils.AIMDLimiter(initial=1)
+    ), patch.object(collection_utils, "_backoff_delay", return_value=0.2), patch.object(
+        collection_utils.dynamodb, "batch_get_item", batch_get_item
+    ):
+        retried_done, other, retried = asyncio.run(run())
+
+    assert not retried_done
+    assert other == [{"id": "b"}]
+    assert retried == [{"id": "a"}]
+
+
+def test_batch_get_items_raises_when_keys_stay_unprocessed():
+    """Keys still unprocessed after every retry raise instead of being dropped."""
+
+    def batch_get_item(RequestItems):
+        keys = RequestItems["jobs"]["Keys"]
+        assert len(keys) == 1  # duplicates are removed before the request
+        return {"Responses": {}, "UnprocessedKeys": {"jobs": {"Keys": keys}}}
+
+    with patch.object(collection_utils, "_backoff_delay", return_value=0), patch.object(
+        collection_utils.dynamodb, "batch_get_item", batch_get_item
+    ):
+        try:
+            asyncio.run(
+                collection_utils.batch_get_items(
+                    "jobs", [{"id": "a"}, {"id": "a"}], max_retries=2
+                )
+            )
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("expected RuntimeError")
@@ -0,0 +1,57 @@
+import asyncio
+from decimal import Decimal
+from unittest.mock import patch
+
+from boto3.dynamodb.conditions import Attr, Key
+
+from routers.methods import list_verification_jobs as jobs
+from schemas.datamodel import AssessmentStatus, VerificationJobDto
+
+
+def test_build_list_request_queries_collection_index():
+    """A collection filter queries its index newest first, with created_after in the key."""
+    operation, kwargs = jobs._build_list_request(
+        AssessmentStatus.APPROVED, "col-1", 1700000000
+    )
+    assert operation == "query"
+    assert kwargs == {
+        "IndexName": "collection-created-at-index",
+        "KeyConditionExpression": Key("collection_id").eq("col-1")
+        & Key("created_at").gt(1700000000),
+        "ScanIndexForward": False,
+        "FilterExpression": Attr("status").eq("Approved"),
+    }
+
+
+def test_jobs_to_dtos_matches_validated_dtos():
+    """DTOs built with model_construct equal fully validated ones."""
+    job_item = {
+        "id": "job-1",
+        "created_at": Decimal(1),
+        "updated_at": Decimal(2),
+        "collection_id": "col-1",
+        "status": "Approved",
+        "cost": Decimal("0.25"),
+        "items": [],
+    }
+
+    async def batch_get_items(table_name, keys, **kwargs):
+        if table_name == jobs.collections_table.name:
+            return [{"id": key["id"], "description": "Fences"} for key in keys]
+        return []
+
+    jobs._collection_name_cache.clear()
+    with patch.object(jobs, "batch_get_items", batch_get_items):
+        (dto,) = asyncio.run(jobs._jobs_to_dtos([job_item]))
+    jobs._collection_name_cache.clear()
+
+    assert dto == VerificationJobDto(
+        id="job-1",
+        created_at=1,
+        updated_at=2,
+        collection_id="col-1",
+        status=AssessmentStatus.APPROVED,
+        cost=0.25,
+        collection_name="Fences",
+        total_cost=0.25,
+    )
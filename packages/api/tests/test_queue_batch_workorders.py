@@ -0,0 +1,51 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import queue_batch_workorders as qbw
+
+
+def test_iter_collection_files_skips_duplicate_etags_lazily():
+    """Listed objects are inspected as they are consumed, skipping repeated ETags."""
+    prefix = "collection-batch/WO1/"
+    pages = [
+        {"Contents": [{"Key": prefix + "a.jpg"}, {"Key": prefix + "copy-of-a.jpg"}]},
+        {"Contents": [{"Key": prefix + "b.png"}]},
+    ]
+    e_tags = {prefix + "a.jpg": "1", prefix + "copy-of-a.jpg": "1", prefix + "b.png": "2"}
+    head_calls = []
+
+    def head_object(Bucket, Key):
+        head_calls.append(Key)
+        return {"ContentLength": 1, "ETag": e_tags[Key]}
+
+    paginator = SimpleNamespace(paginate=lambda **kwargs: iter(pages))
+    client = SimpleNamespace(get_paginator=lambda name: paginator, head_object=head_object)
+
+    with patch.object(qbw, "s3_client", client):
+        files = qbw.iter_collection_files("WO1")
+        assert next(files).filename == "a.jpg"
+        assert head_calls == [prefix + "a.jpg"]
+        assert [f.filename for f in files] == ["b.png"]
+
+
+def test_process_collections_writes_workorders_in_one_bulk_write():
+    """All workorders are stored together before any verification job is created."""
+    events = []
+
+    def bulk_create_collections(collections):
+        events.append(("bulk", sorted(collections)))
+
+    async def create_verification_job(request):
+        events.append(("job", request.collection_id))
+
+    with patch.object(qbw, "build_collection", lambda *args: args), patch.object(
+        qbw, "bulk_create_collections", bulk_create_collections
+    ), patch.object(qbw, "create_verification_job", create_verification_job):
+        asyncio.run(qbw.process_collections({"WO1": "A", "WO2": "A,B"}))
+
+    assert events == [
+        ("bulk", [("WO1", "A"), ("WO2", "A,B")]),
+        ("job", "WO1"),
+        ("job", "WO2"),
+    ]
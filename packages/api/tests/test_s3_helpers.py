@@ -0,0 +1,100 @@
+from datetime import datetime
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+import boto3
+from botocore.config import Config
+from botocore.credentials import Credentials
+
+from utils import s3_helpers
+
+FIXED_NOW = datetime(2025, 3, 14, 9, 26, 53)
+REGION = "us-west-2"
+CREDENTIALS = Credentials("AKIDEXAMPLE", "wJalrXUtnFEMI/K7MDENG/bPxRfiCYEXAMPLEKEY")
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return FIXED_NOW.replace(tzinfo=tz)
+
+
+def _botocore_url(credentials: Credentials, method: str, **params) -> str:
+    client = boto3.client(
+        "s3",
+        region_name=REGION,
+        aws_access_key_id=credentials.access_key,
+        aws_secret_access_key=credentials.secret_key,
+        aws_session_token=credentials.token,
+        config=Config(signature_version="s3v4", s3={"addressing_style": "virtual"}),
+    )
+    with patch("botocore.auth.get_current_datetime", return_value=FIXED_NOW):
+        return client.generate_presigned_url(
+            method,
+            Params=params,
+            ExpiresIn=3600,
+            HttpMethod=method.split("_")[0].upper(),
+        )
+
+
+def _local_url(credentials: Credentials, *args, **kwargs) -> str:
+    with patch.object(s3_helpers, "datetime", _FrozenDatetime), patch.object(
+        s3_helpers, "_credentials", return_value=credentials
+    ):
+        return s3_helpers.presign_s3_url(*args, region=REGION, **kwargs)
+
+
+def test_presign_get_matches_botocore():
+    """A local GET URL is identical to botocore's for the same clock and credentials."""
+    key = "temp-uploads/photo 1+(copy).jpg"
+    assert _local_url(CREDENTIALS, "GET", "my-bucket", key, 3600) == _botocore_url(
+        CREDENTIALS, "get_object", Bucket="my-bucket", Key=key
+    )
+
+
+def test_presign_put_with_content_type_matches_botocore():
+    """A Content-Type is signed as a header, as botocore does for put_object."""
+    key = "collections/abc/image.png"
+    local = _local_url(
+        CREDENTIALS, "PUT", "my-bucket", key, 3600, content_type="image/png"
+    )
+    assert local == _botocore_url(
+        CREDENTIALS, "put_object", Bucket="my-bucket", Key=key, ContentType="image/png"
+    )
+
+
+def test_presign_with_session_token_matches_botocore():
+    """Temporary credentials sign the security token (botocore orders it differently)."""
+    credentials = Credentials(
+        CREDENTIALS.access_key, CREDENTIALS.secret_key, "session-token"
+    )
+    local = urlsplit(_local_url(credentials, "GET", "my-bucket", "a.jpg", 3600))
+    expected = urlsplit(
+        _botocore_url(credentials, "get_object", Bucket="my-bucket", Key="a.jpg")
+    )
+    assert local._replace(query="") == expected._replace(query="")
+    assert parse_qs(local.query) == parse_qs(expected.query)
+
+
+def test_download_urls_are_reused():
+    """Repeat downloads of the same object get the cached URL instead of a new signature."""
+    s3_helpers._download_url_cache.clear()
+    with patch.object(
+        s3_helpers, "presign_s3_url", side_effect=["url-1", "url-2"]
+    ) as presign:
+        first = s3_helpers.presign_s3_download_url("my-bucket", "a.jpg", 3600)
+        second = s3_helpers.presign_s3_download_url("my-bucket", "a.jpg", 3600)
+    assert first == second == "url-1"
+    presign.assert_called_once()
+    s3_helpers._download_url_cache.clear()
+
+
+def test_missing_credentials_are_not_cached():
+    """A provider chain that isn't ready yet is retried on the next presign."""
+    with patch.object(s3_helpers, "_resolved_credentials", None), patch.object(
+        s3_helpers._session, "get_credentials", side_effect=[None, CREDENTIALS]
+    ) as get_credentials:
+        assert s3_helpers._credentials() is None
+        assert s3_helpers._credentials() is CREDENTIALS
+        assert s3_helpers._credentials() is CREDENTIALS
+    assert get_credentials.call_count == 2
@@ -0,0 +1,35 @@
+from decimal import Decimal
+
+from routers.methods.collection_utils import dynamodb_item_to_model, to_attribute_values
+from routers.methods.verification_job_utils import model_to_dynamodb_item
+from schemas.datamodel import AssessmentStatus, CollectionFileInstance, VerificationJob
+
+
+def test_model_to_dynamodb_item_round_trips_with_dynamodb_types():
+    """Floats become Decimals, enums their values and None fields are dropped, reversibly."""
+    job = VerificationJob(
+        id="job-1",
+        created_at=1700000000,
+        updated_at=1700000001,
+        collection_id="col-1",
+        status=AssessmentStatus.ASSESSING,
+        confidence=0.8,
+        files=[
+            CollectionFileInstance(
+                id="file-1",
+                created_at=1700000000,
+                s3_key="collections/col-1/a.jpg",
+                content_type="image/jpeg",
+                filename="a.jpg",
+            )
+        ],
+    )
+    item = model_to_dynamodb_item(job)
+
+    assert item["status"] == "Assessing"
+    assert item["confidence"] == Decimal("0.8")
+    assert "error_message" not in item
+    assert "size" not in item["files"][0]
+    # boto3 rejects floats, so the whole tree must serialise without error
+    to_attribute_values(item)
+    assert dynamodb_item_to_model(item, VerificationJob) == job
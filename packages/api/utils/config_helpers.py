@@ -1,8 +1,10 @@
-import boto3
+import threading
 import time
+from cachetools import TTLCache
 from typing import Dict, Any, Optional
 from datetime import datetime
 import logging
+from aws_clients import dynamodb
 from constants import LLM_CONFIG_TABLE_NAME
 
 logger = logging.getLogger(__name__)
@@ -12,7 +14,10 @@ CONFIG_TYPE_SYSTEM_PROMPT = "system_prompt"
 CONFIG_TYPE_MODEL_ID = "model_id"
 VERIFICATION_JOB_SECOND_PASS = "verification_second_pass"
 
-dynamodb = boto3.resource("dynamodb")
+# Active configs change rarely but are read on every inference request, so they are
+# cached briefly in-process and invalidated whenever this process saves a new value
+_active_config_cache: TTLCache = TTLCache(maxsize=8, ttl=60)
+_active_config_cache_lock = threading.Lock()
 
 
 def get_config_table():
@@ -53,11 +58,25 @@ def save_config(
         logger.warning(f"Error deactivating existing config: {e}")
 
     table.put_item(Item=item)
+    with _active_config_cache_lock:
+        _active_config_cache.pop(config_type, None)
     return item
 
 
 def load_active_config(config_type: str):
     """Load the currently active configuration of the specified type."""
+    with _active_config_cache_lock:
+        if config_type in _active_config_cache:
+            return _active_config_cache[config_type]
+
+    config = _query_active_config(config_type)
+    with _active_config_cache_lock:
+        _active_config_cache[config_type] = config
+    return config
+
+
+def _query_active_config(config_type: str):
+    """Query DynamoDB for the currently active configuration of the specified type."""
     table = get_config_table()
 
     response = table.query(
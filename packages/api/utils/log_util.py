@@ -1,7 +1,7 @@
 import logging
-import boto3
 import uuid
 from datetime import datetime, timezone
+from aws_clients import dynamodb
 from schemas.datamodel import VerificationJobLogEntry
 from constants import VERIFICATION_JOB_LOGS_TABLE_NAME
 from utils.database import model_to_dynamodb_item
@@ -12,7 +12,6 @@ logger.setLevel(logging.INFO)
 # Initialize DynamoDB table resource
 logs_table = None
 if VERIFICATION_JOB_LOGS_TABLE_NAME:
-    dynamodb = boto3.resource("dynamodb")
     logs_table = dynamodb.Table(VERIFICATION_JOB_LOGS_TABLE_NAME)
 else:
     logger.warning(
@@ -20,6 +19,11 @@ else:
     )
 
 
+def level_timestamp_key(level: str, timestamp: int) -> str:
+    """Builds the level_ts sort key; the timestamp is zero-padded so keys sort by time."""
+    return f"{level}#{timestamp:010d}"
+
+
 def store_log_entry(job_id: str, level: int, message: str):
     """Creates and stores a VerificationJobLogEntry in DynamoDB."""
     if not logs_table:
@@ -41,6 +45,8 @@ def store_log_entry(job_id: str, level: int, message: str):
             message=message,
         )
         log_item = model_to_dynamodb_item(log_entry)
+        # Sort key of the job-level-ts-index GSI, used to query logs by level
+        log_item["level_ts"] = level_timestamp_key(log_entry.level, log_entry.timestamp)
         logs_table.put_item(Item=log_item)
     except Exception as e:
         logger.error(f"Failed to store log entry for job {job_id}: {e}")
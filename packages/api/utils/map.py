@@ -1,15 +1,13 @@
-import boto3
 from typing import List, Optional
 from botocore.exceptions import ClientError
 from schemas.datamodel import AddressSuggestion
-from constants import AWS_REGION, LOCATION_INDEX_NAME
-
-client = boto3.client("location", region_name=AWS_REGION)
+from aws_clients import location_client
+from constants import LOCATION_INDEX_NAME
 
 
 def get_coordinates_from_address(address):
     """Returns the latitude and longitude of a given address using Amazon Location Services."""
-    response = client.search_place_index_for_text(
+    response = location_client().search_place_index_for_text(
         IndexName=LOCATION_INDEX_NAME,
         Text=address,
         MaxResults=1,
@@ -34,7 +32,7 @@ def address_lookup(lat: float, lon: float) -> Optional[str]:
     lon = max(min(lon, 180), -180)
     lat = max(min(lat, 90), -90)
 
-    response = client.search_place_index_for_position(
+    response = location_client().search_place_index_for_position(
         IndexName=LOCATION_INDEX_NAME,
         Position=[lon, lat],
     )
@@ -57,7 +55,7 @@ def get_address_suggestions(
         return []
 
     try:
-        response = client.search_place_index_for_text(
+        response = location_client().search_place_index_for_text(
             IndexName=LOCATION_INDEX_NAME,
             Text=query_text,
             MaxResults=max_results,
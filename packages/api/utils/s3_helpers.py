@@ -1,11 +1,160 @@
+import hashlib
+import hmac
 import logging
+import threading
+from datetime import datetime, timezone
+from functools import lru_cache
+from urllib.parse import quote
 import boto3
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, NoCredentialsError
+from cachetools import TLRUCache
 from decimal import Decimal
-from typing import Any
+from typing import Any, Optional
+
+from constants import AWS_REGION
 
 logger = logging.getLogger(__name__)
 
+_session = boto3.session.Session()
+_resolved_credentials = None
+_credentials_lock = threading.Lock()
+
+
+def _credentials():
+    """
+    Returns the session's credentials, resolving them until a provider yields some.
+
+    Refreshable credentials renew themselves, so callers take a fresh
+    get_frozen_credentials() snapshot per presign rather than holding on to keys.
+    """
+    global _resolved_credentials
+    if _resolved_credentials is None:
+        with _credentials_lock:
+            if _resolved_credentials is None:
+                _resolved_credentials = _session.get_credentials()
+    return _resolved_credentials
+
+
+def warm_presign_credentials() -> None:
+    """
+    Resolves credentials for local presigning ahead of the first upload or download
+    URL, so that request doesn't wait on the credential provider chain (or STS).
+    """
+    try:
+        credentials = _credentials()
+        if credentials is not None:
+            credentials.get_frozen_credentials()
+    except Exception:
+        # Warming is best effort; a failure here surfaces on the first presign instead
+        logger.warning("Failed to warm presign credentials", exc_info=True)
+
+
+@lru_cache(maxsize=8)
+def _signing_key(secret_key: str, date_stamp: str, region: str) -> bytes:
+    """Derives the SigV4 signing key, which only changes per day and region."""
+    key = hmac.new(
+        f"AWS4{secret_key}".encode(), date_stamp.encode(), hashlib.sha256
+    ).digest()
+    for part in (region, "s3", "aws4_request"):
+        key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+    return key
+
+
+def presign_s3_url(
+    method: str,
+    bucket: str,
+    key: str,
+    expires_in: int,
+    region: str = AWS_REGION,
+    content_type: Optional[str] = None,
+) -> str:
+    """
+    Builds a SigV4 query-string presigned URL for a single S3 object.
+
+    Equivalent to s3_client.generate_presigned_url for get_object/put_object, but
+    signs locally without going through botocore's operation model on every call.
+    As with put_object's ContentType, a content_type is signed as a header, so the
+    upload must send that exact Content-Type.
+    """
+    credentials = _credentials()
+    if credentials is None:
+        raise NoCredentialsError()
+    frozen = credentials.get_frozen_credentials()
+
+    now = datetime.now(timezone.utc)
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    date_stamp = amz_date[:8]
+    scope = f"{date_stamp}/{region}/s3/aws4_request"
+
+    # Virtual-hosted addressing, falling back to path style for dotted bucket names
+    encoded_key = quote(key, safe="/~")
+    if "." in bucket:
+        host = f"s3.{region}.amazonaws.com"
+        path = f"/{bucket}/{encoded_key}"
+    else:
+        host = f"{bucket}.s3.{region}.amazonaws.com"
+        path = f"/{encoded_key}"
+
+    if content_type:
+        signed_headers = "content-type;host"
+        canonical_headers = f"content-type:{content_type.strip()}\nhost:{host}\n"
+    else:
+        signed_headers = "host"
+        canonical_headers = f"host:{host}\n"
+
+    params = {
+        "X-Amz-Algorithm": "AWS4-HMAC-SHA256",
+        "X-Amz-Credential": f"{frozen.access_key}/{scope}",
+        "X-Amz-Date": amz_date,
+        "X-Amz-Expires": str(expires_in),
+        "X-Amz-SignedHeaders": signed_headers,
+    }
+    if frozen.token:
+        params["X-Amz-Security-Token"] = frozen.token
+    query = "&".join(
+        f"{quote(k, safe='-_.~')}={quote(v, safe='-_.~')}"
+        for k, v in sorted(params.items())
+    )
+
+    canonical_request = (
+        f"{method}\n{path}\n{query}\n{canonical_headers}\n{signed_headers}\nUNSIGNED-PAYLOAD"
+    )
+    string_to_sign = "\n".join(
+        (
+            "AWS4-HMAC-SHA256",
+            amz_date,
+            scope,
+            hashlib.sha256(canonical_request.encode()).hexdigest(),
+        )
+    )
+    signature = hmac.new(
+        _signing_key(frozen.secret_key, date_stamp, region),
+        string_to_sign.encode(),
+        hashlib.sha256,
+    ).hexdigest()
+    return f"https://{host}{path}?{query}&X-Amz-Signature={signature}"
+
+
+# Download URLs are reused for 11/12 of their lifetime, so repeat requests return
+# identical URLs (which browsers can cache) and every handed-out URL stays valid
+# for at least the remaining twelfth. Keys are (bucket, s3_key, expires_in).
+_download_url_cache: TLRUCache = TLRUCache(
+    maxsize=10_000, ttu=lambda key, _url, now: now + key[2] * 11 / 12
+)
+_download_url_cache_lock = threading.Lock()
+
+
+def presign_s3_download_url(bucket: str, key: str, expires_in: int) -> str:
+    """Returns a presigned GET URL, reusing a recently signed one for the same object."""
+    cache_key = (bucket, key, expires_in)
+    with _download_url_cache_lock:
+        url = _download_url_cache.get(cache_key)
+    if url is None:
+        url = presign_s3_url("GET", bucket, key, expires_in)
+        with _download_url_cache_lock:
+            _download_url_cache[cache_key] = url
+    return url
+
 
 def parse_decimal(value: Any) -> Any:
     """Recursively convert Decimal objects to float/int for JSON compatibility."""
@@ -23,12 +172,16 @@ def parse_decimal(value: Any) -> Any:
 
 def generate_presigned_urls_for_job_files(
     verification_job_id: str,
-    s3_client,
     verification_jobs_table,
     storage_bucket_name: str,
     expires_in: int = 3600,
-) -> dict[str, str]:
-    """Retrieves a verification job and generates presigned GET URLs for its files."""
+) -> Optional[dict[str, str]]:
+    """
+    Retrieves a verification job and generates presigned GET URLs for its files.
+
+    Returns None if the job does not exist, and an empty dict if it has no files.
+    DynamoDB errors are logged and re-raised.
+    """
     presigned_urls = {}
     logger.info(f"Generating presigned URLs for job: {verification_job_id}")
 
@@ -37,7 +190,7 @@ def generate_presigned_urls_for_job_files(
         item = response.get("Item")
         if not item:
             logger.warning(f"Verification job {verification_job_id} not found")
-            return {}
+            return None
 
         files_list = item.get("files", [])
         if not isinstance(files_list, list) or not files_list:
@@ -55,11 +208,7 @@ def generate_presigned_urls_for_job_files(
 
             if s3_key:
                 try:
-                    url = s3_client.generate_presigned_url(
-                        "get_object",
-                        Params={"Bucket": storage_bucket_name, "Key": s3_key},
-                        ExpiresIn=expires_in,
-                    )
+                    url = presign_s3_download_url(storage_bucket_name, s3_key, expires_in)
                     presigned_urls[file_id] = url
                 except ClientError:
                     logger.warning(f"Error generating URL for file {file_id}")
@@ -68,7 +217,7 @@ def generate_presigned_urls_for_job_files(
 
     except ClientError:
         logger.error(f"DynamoDB error fetching job {verification_job_id}")
-        return {}
+        raise
     except Exception:
         logger.error(f"Unexpected error for job {verification_job_id}")
         return {}
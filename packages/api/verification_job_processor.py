@@ -3,9 +3,8 @@ from datetime import datetime, timezone
 import json
 from logging import INFO
 import os
-import boto3
 from boto3.dynamodb.conditions import Key
-from mypy_boto3_dynamodb import DynamoDBServiceResource
+from aws_clients import dynamodb
 from utils.log_util import store_log_entry
 from utils.config_helpers import get_verification_job_second_pass
 from utils.llm import calculate_llm_pricing
@@ -22,8 +21,6 @@ from item_processing.item_processor import (
 from item_processing.aws_helpers import get_image_bytes_from_s3, detect_labels_s3
 from constants import STORAGE_BUCKET_NAME
 
-# Initialize DynamoDB client
-dynamodb: DynamoDBServiceResource = boto3.resource("dynamodb")
 verification_jobs_table = dynamodb.Table(os.environ["VERIFICATION_JOBS_TABLE_NAME"])
 
 
@@ -74,7 +71,7 @@ async def async_handler(event):
     current_timestamp = int(datetime.now(timezone.utc).timestamp())
     
     # Fetch the verification job with all associated data
-    verification_job, _ = fetch_verification_job(verification_job_id)
+    verification_job, _ = await fetch_verification_job(verification_job_id)
     
     try:
         verification_job.status = AssessmentStatus.ASSESSING
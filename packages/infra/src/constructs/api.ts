@@ -19,6 +19,7 @@ export class ApiConstructProps {
   readonly storageBucket: Bucket;
   readonly itemsTable: Table;
   readonly fileChecksTable: Table;
+  readonly jobItemsTable: Table;
   readonly collectionsTable: Table;
   readonly llmConfigTable: Table;
   readonly processingQueue: sqs.Queue;
@@ -56,6 +57,7 @@ export class ApiConstruct extends Construct {
         VERIFICATION_JOBS_TABLE_NAME: props.verificationJobsTable.tableName,
         ITEMS_TABLE_NAME: props.itemsTable.tableName,
         FILE_CHECKS_TABLE_NAME: props.fileChecksTable.tableName,
+        JOB_ITEMS_TABLE_NAME: props.jobItemsTable.tableName,
         COLLECTIONS_TABLE_NAME: props.collectionsTable.tableName,
         STAGE: "prod",
         LOCATION_INDEX_NAME: props.placeIndex.indexName,
@@ -77,6 +79,7 @@ export class ApiConstruct extends Construct {
     props.verificationJobsTable.grantReadWriteData(apiFunction.role!);
     props.itemsTable.grantReadWriteData(apiFunction.role!);
     props.fileChecksTable.grantReadWriteData(apiFunction.role!);
+    props.jobItemsTable.grantReadWriteData(apiFunction.role!);
     props.collectionsTable.grantReadWriteData(apiFunction.role!);
     props.verificationJobLogsTable.grantReadWriteData(apiFunction.role!);
     props.llmConfigTable.grantReadWriteData(apiFunction.role!);
@@ -11,6 +11,7 @@ export class DatabaseConstruct extends Construct {
   public readonly fileChecksTable: dynamodb.Table;
   public readonly llmConfigTable: dynamodb.Table;
   public readonly agentsTable: dynamodb.Table;
+  public readonly jobItemsTable: dynamodb.Table;
 
   constructor(scope: Construct, id: string) {
     super(scope, id);
@@ -24,6 +25,13 @@ export class DatabaseConstruct extends Construct {
       removalPolicy: RemovalPolicy.DESTROY, // Use RETAIN in production
     });
 
+    // GSI for looking up Agents by name
+    this.agentsTable.addGlobalSecondaryIndex({
+      indexName: "name-index",
+      partitionKey: { name: "name", type: dynamodb.AttributeType.STRING },
+      projectionType: dynamodb.ProjectionType.ALL,
+    });
+
     // --- Verification Jobs Table ---
     this.verificationJobsTable = new dynamodb.Table(
       this,
@@ -58,6 +66,17 @@ export class DatabaseConstruct extends Construct {
       projectionType: dynamodb.ProjectionType.ALL, // Project all attributes for simplicity
     });
 
+    // GSI for listing a collection's Verification Jobs, optionally created after a time
+    this.verificationJobsTable.addGlobalSecondaryIndex({
+      indexName: "collection-created-at-index",
+      partitionKey: {
+        name: "collection_id",
+        type: dynamodb.AttributeType.STRING,
+      },
+      sortKey: { name: "created_at", type: dynamodb.AttributeType.NUMBER },
+      projectionType: dynamodb.ProjectionType.ALL,
+    });
+
     new CfnOutput(this, "VerificationJobsTableName", {
       value: this.verificationJobsTable.tableName,
     });
@@ -93,6 +112,18 @@ export class DatabaseConstruct extends Construct {
       projectionType: dynamodb.ProjectionType.ALL, // Project all attributes
     });
 
+    // GSI for querying a job's logs at one level, newest first, without a filter
+    this.verificationJobLogsTable.addGlobalSecondaryIndex({
+      indexName: "job-level-ts-index",
+      partitionKey: {
+        name: "verification_job_id",
+        type: dynamodb.AttributeType.STRING,
+      },
+      // "<LEVEL>#<zero-padded timestamp>", so begins_with selects a level in time order
+      sortKey: { name: "level_ts", type: dynamodb.AttributeType.STRING },
+      projectionType: dynamodb.ProjectionType.ALL,
+    });
+
     new CfnOutput(this, "VerificationJobLogsTableName", {
       value: this.verificationJobLogsTable.tableName,
     });
@@ -104,6 +135,13 @@ export class DatabaseConstruct extends Construct {
       // pointInTimeRecovery: true,
     });
 
+    // GSI for looking up Items by name
+    this.itemsTable.addGlobalSecondaryIndex({
+      indexName: "name-index",
+      partitionKey: { name: "name", type: dynamodb.AttributeType.STRING },
+      projectionType: dynamodb.ProjectionType.ALL,
+    });
+
     new CfnOutput(this, "ItemsTableName", {
       value: this.itemsTable.tableName,
     });
@@ -142,6 +180,26 @@ export class DatabaseConstruct extends Construct {
       value: this.fileChecksTable.tableName,
     });
 
+    // --- Job Items Table ---
+    // Maps each Item to the verification jobs that use it, so checking whether an
+    // Item is in use is a single query rather than a scan of every job
+    this.jobItemsTable = new dynamodb.Table(this, "JobItemsTable", {
+      partitionKey: {
+        name: "item_id",
+        type: dynamodb.AttributeType.STRING,
+      },
+      sortKey: {
+        name: "verification_job_id",
+        type: dynamodb.AttributeType.STRING,
+      },
+      billingMode: dynamodb.BillingMode.PAY_PER_REQUEST,
+      removalPolicy: RemovalPolicy.DESTROY, // Use RETAIN in production
+    });
+
+    new CfnOutput(this, "JobItemsTableName", {
+      value: this.jobItemsTable.tableName,
+    });
+
     // --- LLM Config Table ---
     this.llmConfigTable = new dynamodb.Table(this, "LlmConfigTable", {
       partitionKey: {
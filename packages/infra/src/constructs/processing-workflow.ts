@@ -17,6 +17,7 @@ export interface ProcessingWorkflowProps {
   readonly verificationJobLogsTable: Table;
   readonly itemsTable: Table;
   readonly fileChecksTable: Table;
+  readonly jobItemsTable: Table;
   readonly collectionsTable: Table;
   readonly llmConfigTable: Table;
   readonly placeIndex: location.CfnPlaceIndex;
@@ -38,6 +39,7 @@ export class ProcessingWorkflowConstruct extends Construct {
       VERIFICATION_JOBS_TABLE_NAME: props.verificationJobsTable.tableName,
       ITEMS_TABLE_NAME: props.itemsTable.tableName,
       FILE_CHECKS_TABLE_NAME: props.fileChecksTable.tableName,
+      JOB_ITEMS_TABLE_NAME: props.jobItemsTable.tableName,
       COLLECTIONS_TABLE_NAME: props.collectionsTable.tableName,
       LOCATION_INDEX_NAME: props.placeIndex.indexName,
       STAGE: "prod",
@@ -161,6 +163,7 @@ export class ProcessingWorkflowConstruct extends Construct {
       props.verificationJobLogsTable.grantReadWriteData(lambdaFunction);
       props.itemsTable.grantReadWriteData(lambdaFunction);
       props.fileChecksTable.grantReadWriteData(lambdaFunction);
+      props.jobItemsTable.grantReadWriteData(lambdaFunction);
       props.collectionsTable.grantReadWriteData(lambdaFunction);
       props.llmConfigTable.grantReadWriteData(lambdaFunction);
       props.agentsTable.grantReadWriteData(lambdaFunction);
@@ -85,6 +85,7 @@ export class InfraStack extends cdk.Stack {
         verificationJobsTable: data.verificationJobsTable,
         itemsTable: data.itemsTable,
         fileChecksTable: data.fileChecksTable,
+        jobItemsTable: data.jobItemsTable,
         collectionsTable: data.collectionsTable,
         llmConfigTable: data.llmConfigTable,
         bedrockRoleArn,
@@ -99,6 +100,7 @@ export class InfraStack extends cdk.Stack {
       verificationJobsTable: data.verificationJobsTable,
       itemsTable: data.itemsTable,
       fileChecksTable: data.fileChecksTable,
+      jobItemsTable: data.jobItemsTable,
       collectionsTable: data.collectionsTable,
       llmConfigTable: data.llmConfigTable,
       processingQueue: workflow.processingQueue,